@@ -13,17 +13,26 @@ from flask import (
     jsonify,
     stream_with_context,
 )
+import atexit
+import csv
+import hmac
+import io
 import json
-import threading
 import queue
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from src.config import Config
-from src.api.client import ChessResultsClient
-from src.parsers.url_parser import parse_chess_url
-from src.services.monitor import TournamentMonitor
-from src.models.tournament import Tournament
+from src.parsers.url_parser import parse_chess_url, player_key
+from src.services.engine import MonitorEngine, prune_tournament_caches
+from src.services.ipc import EventSubscriber
+from src.services.standings import standings_fetcher
+from src.services.crosstable import crosstables
+from src.services.memory import memory_registry
+from src.services.freshness import freshness_tracker
+from src.services.reaper import SessionReaper
+from src.services.frozen import frozen_archive, response_parts
 from src.database import Database
 
 app = Flask(__name__, template_folder="./templates")
@@ -39,133 +48,115 @@ db.create_tables()
 event_queues: Dict[str, queue.Queue] = {}
 
 
-def serialize_tournament(tournament: Tournament) -> dict:
-    """Convert Tournament object to JSON-serializable dict"""
-    return {
-        "tournament_id": tournament.tournament_id,
-        "player": {
-            "name": tournament.player.name,
-            "snr": tournament.player.snr,
-            "starting_rank": tournament.player.starting_rank,
-            "current_rank": tournament.player.current_rank,
-        },
-        "matches": [
-            {
-                "round_number": m.round_number,
-                "board_number": m.board_number,
-                "opponent_snr": m.opponent_snr,
-                "opponent_name": m.opponent_name,
-                "result": m.result,
-                "pairing": m.pairing,
-                "color": m.color,
-                "is_completed": m.is_completed(),
-            }
-            for m in tournament.matches
-        ],
-        "total_rounds": tournament.total_rounds,
-        "completed_rounds": tournament.get_completed_rounds(),
-        "is_finished": tournament.is_finished(),
-    }
+# Set by the ASGI entry point (asgi.py) to deliver events to its async streams
+event_sink: Optional[Callable[[str, dict], None]] = None
 
 
-def monitor_worker(session_id: str, config: Config, event_q: queue.Queue):
-    """Background worker to monitor tournament"""
-    print(f"🔧 Monitor worker starting for session: {session_id}")
-    print(f"⚙️  Check interval: {config.check_interval}s")
+def publish_event(session_id: str, data: dict):
+    """Deliver an update to the SSE queue of a session"""
+    if data.get("trace"):
+        freshness_tracker.record(session_id, data["trace"])
+    if event_sink is not None:
+        event_sink(session_id, data)
+        return
+    event_queues.setdefault(session_id, queue.Queue()).put(data)
 
-    try:
-        with ChessResultsClient(config) as client:
-            monitor = TournamentMonitor(config, client)
-
-            def on_update(tournament, new_round, error=None):
-                """Callback when tournament updates"""
-                session = db.get_session_by_id(session_id)
-                if not session:
-                    return
-
-                # Handle error case
-                if error:
-                    print(f"⚠️  Monitor error [{session_id}]: {error}")
-                    error_data = {
-                        "error": error,
-                        "timestamp": datetime.now().isoformat(),
-                        "type": "fetch_error",
-                    }
-                    db.update_session(
-                        session_id, last_update=datetime.now(), error=error
-                    )
-                    event_q.put(error_data)
-                    return
 
-                # Handle normal update
-                if tournament:
-                    print(
-                        f"✅ Update [{session_id}] - Rounds: {tournament.get_completed_rounds()}/{tournament.total_rounds}"
-                    )
-                    data = serialize_tournament(tournament)
-                    data["new_round"] = new_round is not None
-                    data["timestamp"] = datetime.now().isoformat()
+_app_config = Config.from_env()
+memory_registry.register_gauge("event_queues", lambda: len(event_queues))
+memory_registry.register_gauge(
+    "queued_events", lambda: sum(q.qsize() for q in list(event_queues.values()))
+)
 
-                    # Update session in database
-                    db.update_session(session_id, data=data, last_update=datetime.now())
-                    event_q.put(data)
+# Either run the monitoring engine inside this process, or leave polling to the
+# standalone monitor daemon (python monitor_daemon.py) and receive its updates
+# over local IPC
+engine: Optional[MonitorEngine] = None
+subscriber: Optional[EventSubscriber] = None
+
+if _app_config.monitor_mode == "external":
+    subscriber = EventSubscriber(
+        _app_config.ipc_address.split(","),
+        _app_config.ipc_authkey,
+        on_event=publish_event,
+    )
+    subscriber.start()
+else:
+    # Created before any other thread starts: it forks the parse processes
+    engine = MonitorEngine(db, publish=publish_event)
+
+# Memory accounting, and cache eviction when a budget is configured
+memory_registry.start(
+    _app_config.memory_tracing,
+    _app_config.memory_budget_mb,
+    _app_config.memory_check_interval,
+)
 
-            # Update session status
-            db.update_session(session_id, status="running")
-            print(f"▶️  Monitor started for session: {session_id}")
+if engine:
+    engine.start()
+    atexit.register(engine.stop)
 
-            # Run monitor
-            monitor.run(callback=on_update)
 
-            # Mark as finished
-            db.update_session(session_id, status="finished")
-            print(f"🏁 Monitor finished for session: {session_id}")
+# How often a stream checks the journal for events published by another process
+JOURNAL_POLL_INTERVAL = 2  # seconds
 
-    except Exception as e:
-        print(f"❌ Monitor error [{session_id}]: {e}")
-        import traceback
 
-        traceback.print_exc()
-        db.update_session(session_id, status="error", error=str(e))
-        event_q.put({"error": str(e), "type": "worker_error"})
+def monitored_elsewhere(session_id: str) -> bool:
+    """
+    Whether a session's events are published in another process
 
+    With the embedded engine only the process holding a session's lease
+    publishes its events, so streams served by every other process follow
+    the journal instead. In external mode each daemon broadcasts to every
+    web process.
+    """
+    return engine is not None and session_id not in engine.session_keys
 
-def restart_existing_sessions():
-    """Restart monitoring threads for existing sessions on app startup"""
-    print("🔄 Checking for existing sessions to restart...")
-    active_sessions = db.get_all_sessions()
 
-    for session in active_sessions:
-        # Skip finished or error sessions
-        if session["status"] in ["finished", "error"]:
-            continue
+def drop_local_state(live_session_ids: set):
+    """Free the queues and metrics of sessions that are no longer live"""
+    # A session created after the reaper read its IDs may already have a
+    # queue: list the queues first, then read the live IDs again
+    queued = list(event_queues)
+    live_session_ids = live_session_ids | db.get_session_ids()
+    for session_id in queued:
+        if session_id not in live_session_ids:
+            event_queues.pop(session_id, None)
+    freshness_tracker.prune(live_session_ids)
 
-        session_id = session["id"]
-        config_dict = session["config"]
 
-        # Recreate Config object
-        config = Config.from_env()
-        config.tournament_id = config_dict["tournament_id"]
-        config.player_snr = config_dict["player_snr"]
-        config.server = config_dict["server"]
-        config.federation = config_dict["federation"]
-        config.check_interval = config_dict["check_interval"]
+# Finished sessions are archived after the retention period; every web
+# process runs a reaper so each one frees its own in-memory state
+reaper = SessionReaper(
+    db,
+    retention_hours=_app_config.session_retention_hours,
+    archive_retention_days=_app_config.archive_retention_days,
+    interval=_app_config.reaper_interval,
+    vacuum_interval=_app_config.vacuum_interval,
+)
+reaper.add_cleanup(drop_local_state)
+reaper.add_cleanup(lambda live: prune_tournament_caches(db.get_live_tournaments()))
+reaper.add_cleanup(
+    lambda live: frozen_archive.prune(_app_config.archive_retention_days)
+)
+reaper.start()
 
-        # Create event queue
-        event_queue = queue.Queue()
-        event_queues[session_id] = event_queue
 
-        # Restart monitoring thread
-        thread = threading.Thread(
-            target=monitor_worker, args=(session_id, config, event_queue), daemon=True
-        )
-        thread.start()
-        print(f"✅ Restarted monitoring for session: {session_id}")
+def start_sessions(sessions: list):
+    """Start monitoring newly created (session_id, config) sessions"""
+    if engine:
+        engine.claim_and_start(sessions)
+    else:
+        # Let the daemon lease them right away instead of on its next cycle
+        subscriber.send_command({"command": "rebalance"})
 
-    if active_sessions:
-        print(
-            f"🔄 Restarted {len([s for s in active_sessions if s['status'] not in ['finished', 'error']])} monitoring sessions"
-        )
+
+def stop_session(session_id: str):
+    """Stop monitoring a session wherever its monitor runs"""
+    if engine:
+        engine.stop_session(session_id)
+    else:
+        subscriber.send_command({"command": "stop", "session_id": session_id})
 
 
 @app.route("/")
@@ -177,9 +168,8 @@ def index():
 @app.route("/api/monitor", methods=["POST"])
 def start_monitor():
     """Start monitoring a tournament"""
-    # Check session limit
-    active_sessions = db.get_all_sessions()
-    if len(active_sessions) >= MAX_SESSIONS:
+    # Check session limit; finished sessions don't count
+    if db.count_active_sessions() >= MAX_SESSIONS:
         return jsonify(
             {
                 "error": f"Maximum of {MAX_SESSIONS} sessions reached. Please stop a session before starting a new one."
@@ -197,93 +187,377 @@ def start_monitor():
     if not parsed:
         return jsonify({"error": "Invalid chess-results.com URL"}), 400
 
-    # Create config
-    config = Config.from_env()
-    config.tournament_id = parsed["tournament_id"]
-    config.player_snr = parsed["player_snr"]
-    config.server = parsed["server"]
-    config.federation = parsed["federation"]
-
-    # Override check interval if provided
-    check_interval = data.get("check_interval")
-    if check_interval:
-        config.check_interval = int(check_interval)
+    # Create config, overriding check interval if provided
+    config = Config.from_session(parsed, data.get("check_interval"))
 
-    # Create session
+    # Save session to database
     session_id = str(uuid.uuid4())
-    event_queue = queue.Queue()
-    event_queues[session_id] = event_queue
+    db.create_session(session_id, url, config.to_session_dict())
 
-    # Save session to database
-    db.create_session(
-        session_id,
-        url,
+    # Start monitoring in background thread
+    start_sessions([(session_id, config)])
+
+    return jsonify(
         {
-            "tournament_id": config.tournament_id,
-            "player_snr": config.player_snr,
-            "server": config.server,
-            "federation": config.federation,
-            "check_interval": config.check_interval,
-        },
+            "session_id": session_id,
+            "message": "Monitoring started",
+        }
     )
 
-    # Start monitoring in background thread
-    thread = threading.Thread(
-        target=monitor_worker, args=(session_id, config, event_queue), daemon=True
+
+def read_bulk_urls() -> Optional[list]:
+    """
+    Collect URLs from a JSON list, an uploaded CSV file or a CSV body
+
+    Returns:
+        The URLs, or None if a JSON body isn't an object with a list of
+        strings under "urls"
+    """
+    if request.is_json:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return None
+        urls = data.get("urls", [])
+        if not isinstance(urls, list) or not all(isinstance(u, str) for u in urls):
+            return None
+        return [url.strip() for url in urls]
+
+    if "file" in request.files:
+        text = request.files["file"].read().decode("utf-8-sig")
+    else:
+        text = request.get_data(as_text=True)
+
+    # Take every cell that looks like a chess-results URL, ignoring headers
+    return [
+        cell.strip()
+        for row in csv.reader(io.StringIO(text))
+        for cell in row
+        if "chess-results.com" in cell
+    ]
+
+
+@app.route("/api/monitor/bulk", methods=["POST"])
+def start_monitor_bulk():
+    """Start monitoring many players from a list of URLs or a CSV"""
+    urls = read_bulk_urls()
+    if urls is None:
+        return (
+            jsonify({"error": 'Expected a JSON object with a "urls" list of strings'}),
+            400,
+        )
+    if not urls:
+        return jsonify({"error": "No URLs provided"}), 400
+
+    check_interval = request.args.get("check_interval")
+    if request.is_json:
+        check_interval = request.json.get("check_interval", check_interval)
+
+    # One scan of existing sessions for both the limit and deduplication;
+    # finished sessions don't count toward the limit
+    existing_sessions = db.get_all_sessions()
+    seen = {player_key(session["config"]) for session in existing_sessions}
+    available = MAX_SESSIONS - sum(
+        1
+        for session in existing_sessions
+        if session["status"] not in ["finished", "error"]
     )
-    thread.start()
+
+    new_sessions = []
+    invalid, duplicates, rejected = [], [], []
+    for url in urls:
+        parsed = parse_chess_url(url)
+        if not parsed:
+            invalid.append(url)
+            continue
+
+        key = player_key(parsed)
+        if key in seen:
+            duplicates.append(url)
+            continue
+        seen.add(key)
+
+        if len(new_sessions) >= available:
+            rejected.append(url)
+            continue
+
+        config = Config.from_session(parsed, check_interval)
+        new_sessions.append((str(uuid.uuid4()), url, config))
+
+    # Save all sessions in a single transaction
+    if new_sessions:
+        db.create_sessions(
+            [
+                (session_id, url, config.to_session_dict())
+                for session_id, url, config in new_sessions
+            ]
+        )
+
+    # Start monitoring, spreading first polls across the check interval
+    start_sessions([(session_id, config) for session_id, _, config in new_sessions])
 
     return jsonify(
         {
-            "session_id": session_id,
-            "message": "Monitoring started",
+            "session_ids": [session_id for session_id, _, _ in new_sessions],
+            "invalid": invalid,
+            "duplicates": duplicates,
+            "rejected": rejected,
+            "message": f"Monitoring started for {len(new_sessions)} players",
         }
     )
 
 
+def session_summary(session: dict) -> dict:
+    """Listing entry for a session"""
+    return {
+        "id": session["id"],
+        "status": session["status"],
+        "created_at": session["created_at"].isoformat(),
+        "last_update": session["last_update"].isoformat()
+        if session["last_update"]
+        else None,
+        "config": session["config"],
+    }
+
+
+def session_status(session: dict) -> dict:
+    """Current status and latest data of a session"""
+    return {
+        "session_id": session["id"],
+        "status": session["status"],
+        "created_at": session["created_at"].isoformat(),
+        "last_update": (
+            session["last_update"].isoformat() if session["last_update"] else None
+        ),
+        "data": session["data"],
+        "error": session.get("error"),
+        "archived": session.get("archived_at") is not None,
+    }
+
+
 @app.route("/api/sessions", methods=["GET"])
 def get_sessions():
     """Get all active monitoring sessions"""
     active_sessions = db.get_all_sessions()
     return jsonify(
-        {
-            "sessions": [
-                {
-                    "id": session["id"],
-                    "status": session["status"],
-                    "created_at": session["created_at"].isoformat(),
-                    "last_update": session["last_update"].isoformat()
-                    if session["last_update"]
-                    else None,
-                    "config": session["config"],
-                }
-                for session in active_sessions
-            ]
-        }
+        {"sessions": [session_summary(session) for session in active_sessions]}
+    )
+
+
+def frozen_response(frozen) -> Response:
+    """Serve a frozen snapshot with its ETag and immutable cache headers"""
+    status, headers, body = response_parts(
+        frozen,
+        request.headers.get("If-None-Match", ""),
+        request.headers.get("Accept-Encoding", ""),
     )
+    return Response(body, status=status, headers=headers)
 
 
 @app.route("/api/status/<session_id>", methods=["GET"])
 def get_status(session_id):
     """Get current status of a specific monitoring session"""
-    session = db.get_session_by_id(session_id)
+    # Finished sessions are served from their frozen snapshot
+    frozen = frozen_archive.get(session_id)
+    if frozen is not None:
+        return frozen_response(frozen)
+
+    session = db.get_session_by_id(session_id) or db.get_archived_session(session_id)
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
+    frozen = frozen_archive.freeze(session)
+    if frozen is not None:
+        return frozen_response(frozen)
+    return jsonify(session_status(session))
+
+
+def downsample_history(events: list, bucket_seconds: int) -> list:
+    """Keep only the last rank event per time bucket; results and pairings are kept"""
+    last_rank_per_bucket = {}
+    others = []
+    for event in events:
+        if event["type"] == "rank":
+            bucket = int(event["recorded_at"].timestamp()) // bucket_seconds
+            last_rank_per_bucket[bucket] = event
+        else:
+            others.append(event)
+
+    # Both lists are already in time order; sorted() is stable for ties
+    return sorted(
+        others + list(last_rank_per_bucket.values()),
+        key=lambda event: event["recorded_at"],
+    )
+
+
+def filter_history(events: list, since, until, event_type, limit) -> list:
+    """Apply the history query filters to an archived session's events"""
+    events = [
+        event
+        for event in events
+        if (since is None or event["recorded_at"] >= since)
+        and (until is None or event["recorded_at"] <= until)
+        and (event_type is None or event["type"] == event_type)
+    ]
+    return events[:limit] if limit is not None else events
+
+
+@app.route("/api/history/<session_id>", methods=["GET"])
+def get_history(session_id):
+    """Get the timeline of results, rank moves and pairings for a session"""
+    session = db.get_session_by_id(session_id) or db.get_archived_session(session_id)
+    if not session:
+        return jsonify({"error": "Session not found"}), 404
+
+    try:
+        since = request.args.get("since")
+        until = request.args.get("until")
+        since = datetime.fromisoformat(since) if since else None
+        until = datetime.fromisoformat(until) if until else None
+        bucket = int(request.args.get("bucket", 0))
+        limit = int(request.args["limit"]) if "limit" in request.args else None
+    except ValueError:
+        return jsonify({"error": "Invalid since, until, bucket or limit"}), 400
+
+    if "history" in session:
+        # Archived sessions carry their whole history in the snapshot
+        events = filter_history(
+            [
+                {**event, "recorded_at": datetime.fromisoformat(event["recorded_at"])}
+                for event in session["history"]
+            ],
+            since=since,
+            until=until,
+            event_type=request.args.get("type"),
+            limit=limit,
+        )
+    else:
+        events = db.get_history(
+            session_id,
+            since=since,
+            until=until,
+            event_type=request.args.get("type"),
+            limit=limit,
+        )
+    if bucket > 0:
+        events = downsample_history(events, bucket)
+
     return jsonify(
         {
-            "session_id": session["id"],
-            "status": session["status"],
-            "created_at": session["created_at"].isoformat(),
-            "last_update": (
-                session["last_update"].isoformat() if session["last_update"] else None
-            ),
-            "data": session["data"],
-            "error": session.get("error"),
+            "session_id": session_id,
+            "events": [
+                {**event, "recorded_at": event["recorded_at"].isoformat()}
+                for event in events
+            ],
         }
     )
 
 
+EXPORT_CSV_COLUMNS = [
+    "session_id",
+    "tournament_id",
+    "player_snr",
+    "player_name",
+    "status",
+    "current_rank",
+    "points",
+    "round_number",
+    "board_number",
+    "color",
+    "opponent_snr",
+    "opponent_name",
+    "opponent_rating",
+    "result",
+    "last_update",
+]
+
+
+def export_csv_rows(session: dict):
+    """One CSV row per match of a session (one bare row if it has no data yet)"""
+    data = session["data"] or {}
+    player = data.get("player") or {}
+    base = {
+        "session_id": session["id"],
+        "tournament_id": session["config"].get("tournament_id"),
+        "player_snr": session["config"].get("player_snr"),
+        "player_name": player.get("name"),
+        "status": session["status"],
+        "current_rank": player.get("current_rank"),
+        "points": player.get("points"),
+        "last_update": (
+            session["last_update"].isoformat() if session["last_update"] else None
+        ),
+    }
+    matches = data.get("matches") or [{}]
+    for match in matches:
+        yield [
+            base.get(column, match.get(column, "")) or ""
+            for column in EXPORT_CSV_COLUMNS
+        ]
+
+
+@app.route("/api/export", methods=["GET"])
+def export_sessions():
+    """Stream all sessions and results as NDJSON (default) or CSV"""
+    export_format = request.args.get("format", "ndjson").lower()
+    if export_format not in ("ndjson", "csv"):
+        return jsonify({"error": "format must be ndjson or csv"}), 400
+
+    try:
+        since = request.args.get("since")
+        until = request.args.get("until")
+        since = datetime.fromisoformat(since) if since else None
+        until = datetime.fromisoformat(until) if until else None
+    except ValueError:
+        return jsonify({"error": "Invalid since or until"}), 400
+
+    sessions = db.iter_sessions(
+        tournament_id=request.args.get("tournament"),
+        status=request.args.get("status"),
+        since=since,
+        until=until,
+        include_archived=True,
+    )
+
+    def generate_ndjson():
+        for session in sessions:
+            yield json.dumps(session, default=lambda value: value.isoformat()) + "\n"
+
+    def generate_csv():
+        # Reuse one small buffer so each chunk is only the rows just written
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_CSV_COLUMNS)
+        for session in sessions:
+            writer.writerows(export_csv_rows(session))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+
+    if export_format == "csv":
+        body, mimetype, extension = generate_csv(), "text/csv", "csv"
+    else:
+        body, mimetype, extension = generate_ndjson(), "application/x-ndjson", "ndjson"
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=sessions.{extension}",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+def format_sse(data: dict) -> str:
+    """Format an event for the SSE stream, with its journal seq as the event ID"""
+    # The freshness trace is server-side bookkeeping
+    payload = json.dumps({key: value for key, value in data.items() if key != "trace"})
+    if data.get("seq") is not None:
+        return f"id: {data['seq']}\ndata: {payload}\n\n"
+    return f"data: {payload}\n\n"
+
+
 @app.route("/api/stream/<session_id>", methods=["GET"])
 def stream_events(session_id):
     """Server-Sent Events stream for real-time updates"""
@@ -291,10 +565,18 @@ def stream_events(session_id):
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
-    if session_id not in event_queues:
-        return jsonify({"error": "Event queue not found"}), 404
+    # Resume point: sent by EventSource on reconnect, or given explicitly
+    resume_from = request.headers.get("Last-Event-ID") or request.args.get("since")
+    if resume_from is not None:
+        try:
+            resume_from = int(resume_from)
+        except ValueError:
+            return jsonify({"error": "Event ID must be an integer"}), 400
 
-    event_queue = event_queues[session_id]
+    # Live events from here on; older ones are only sent when resuming
+    connected_at = time.time()
+    latest_seq = db.get_last_journal_seq(session_id)
+    event_queue = event_queues.setdefault(session_id, queue.Queue())
 
     @stream_with_context
     def generate():
@@ -302,31 +584,73 @@ def stream_events(session_id):
         # Send initial connection message
         yield f'data: {{"type": "connected", "session_id": "{session_id}"}}\n\n'
 
+        # Replay what the client missed from the journal; the live queue may
+        # repeat some of it, so skip anything at or below the last replayed seq
+        last_seq = latest_seq
+        if resume_from is not None:
+            last_seq = resume_from
+            for entry in db.get_journal(session_id, after=resume_from):
+                entry["data"]["seq"] = entry["seq"]
+                yield format_sse(entry["data"])
+                last_seq = entry["seq"]
+
         last_heartbeat = datetime.now()
         heartbeat_interval = 15
         heartbeat_count = 0
 
         while True:
-            try:
-                # Calculate timeout until next heartbeat
-                time_since_heartbeat = (datetime.now() - last_heartbeat).total_seconds()
-                timeout = max(1, heartbeat_interval - time_since_heartbeat)
+            # Calculate timeout until next heartbeat
+            time_since_heartbeat = (datetime.now() - last_heartbeat).total_seconds()
+            timeout = max(1, heartbeat_interval - time_since_heartbeat)
+
+            # Another process monitors the session: its events are in the journal
+            tail = monitored_elsewhere(session_id)
+            if tail:
+                timeout = min(timeout, JOURNAL_POLL_INTERVAL)
 
+            try:
                 # Wait for events with timeout
-                data = event_queue.get(timeout=timeout)
-                yield f"data: {json.dumps(data)}\n\n"
+                events = [event_queue.get(timeout=timeout)]
+            except queue.Empty:
+                events = []
+                if tail:
+                    events = [
+                        {**entry["data"], "seq": entry["seq"]}
+                        for entry in db.get_journal(session_id, after=last_seq)
+                    ]
+                if not events:
+                    if not tail or time_since_heartbeat + timeout >= heartbeat_interval:
+                        # Send heartbeat
+                        heartbeat_count += 1
+                        yield ": heartbeat\n\n"
+                        last_heartbeat = datetime.now()
+                    continue
+
+            for data in events:
+                if data.get("seq") is not None:
+                    if data["seq"] <= last_seq:
+                        continue
+                    last_seq = data["seq"]
+                yield format_sse(data)
                 last_heartbeat = datetime.now()
 
-                # Check if session is finished
-                session = db.get_session_by_id(session_id)
-                if session and session["status"] in ["finished", "error"]:
-                    break
+                # Resumed once the server has written the event out; events
+                # queued before anyone was watching would skew the timing
+                trace = data.get("trace")
+                if trace and trace.get("enqueued", 0) >= connected_at:
+                    freshness_tracker.record(
+                        session_id,
+                        {
+                            "fetch_start": trace["fetch_start"],
+                            "sse_write": time.time(),
+                        },
+                        stages=["sse_write"],
+                    )
 
-            except queue.Empty:
-                # Send heartbeat
-                heartbeat_count += 1
-                yield ": heartbeat\n\n"
-                last_heartbeat = datetime.now()
+            # Check if session is finished
+            session = db.get_session_by_id(session_id)
+            if session and session["status"] in ["finished", "error"]:
+                break
 
     return Response(
         generate(),
@@ -338,6 +662,87 @@ def stream_events(session_id):
     )
 
 
+@app.route("/api/tournament/<tournament_id>/ranking", methods=["GET"])
+def get_tournament_ranking(tournament_id):
+    """Rank all watched players in a tournament against each other"""
+    sessions = [
+        s
+        for s in db.get_all_sessions()
+        if s["config"]["tournament_id"] == tournament_id
+    ]
+    if not sessions:
+        return jsonify({"error": "No sessions for this tournament"}), 404
+
+    players = []
+    for session in sessions:
+        config = session["config"]
+        player = (session["data"] or {}).get("player", {})
+        standings = (
+            standings_fetcher.get_cached_standings(config["server"], tournament_id)
+            or {}
+        )
+        entry = standings.get(config["player_snr"], {})
+
+        players.append(
+            {
+                "session_id": session["id"],
+                "snr": config["player_snr"],
+                "name": player.get("name") or entry.get("name"),
+                "rank": entry.get("rank") or player.get("current_rank"),
+                "points": entry.get("points") or player.get("points"),
+                "status": session["status"],
+            }
+        )
+
+    # Unranked players go last
+    players.sort(
+        key=lambda p: int(p["rank"]) if p["rank"] and p["rank"].isdigit() else 10**9
+    )
+
+    return jsonify({"tournament_id": tournament_id, "players": players})
+
+
+@app.route("/api/tournament/<tournament_id>/standings", methods=["GET"])
+def get_tournament_standings(tournament_id):
+    """Live standings with tiebreaks computed from the round pages seen so far"""
+    # Round pages are only seen by the process running the monitors
+    if engine is None:
+        return (
+            jsonify({"error": "Standings are only served with the embedded monitor"}),
+            501,
+        )
+
+    try:
+        limit = int(request.args["limit"]) if "limit" in request.args else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+
+    server = request.args.get("server")
+    if server is None:
+        servers = {
+            s["config"]["server"]
+            for s in db.get_all_sessions()
+            if s["config"]["tournament_id"] == tournament_id
+        }
+        if not servers:
+            return jsonify({"error": "No sessions for this tournament"}), 404
+        if len(servers) > 1:
+            return jsonify({"error": "Watched on several servers; pass server"}), 400
+        server = servers.pop()
+
+    table = crosstables.get(server, tournament_id)
+    if table is None:
+        return jsonify({"error": "No round pages seen for this tournament"}), 404
+
+    return jsonify(
+        {
+            "tournament_id": tournament_id,
+            "rounds": sorted(table.total_boards),
+            "players": table.standings(limit),
+        }
+    )
+
+
 @app.route("/api/stop/<session_id>", methods=["POST"])
 def stop_monitor(session_id):
     """Stop a specific monitoring session"""
@@ -345,16 +750,43 @@ def stop_monitor(session_id):
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
-    # Remove session from database
+    # Remove session from database and stop a local monitor
     db.delete_session(session_id)
+    stop_session(session_id)
+    frozen_archive.discard(session_id)
 
     # Remove event queue
     if session_id in event_queues:
         del event_queues[session_id]
+    freshness_tracker.forget(session_id)
 
     return jsonify({"message": "Monitoring stopped"})
 
 
+def admin_authorized() -> bool:
+    """Whether the request carries the configured ADMIN_TOKEN as a bearer token"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    return scheme == "Bearer" and bool(_app_config.admin_token) and hmac.compare_digest(
+        token.encode(), _app_config.admin_token.encode()
+    )
+
+
+@app.route("/api/admin/memory", methods=["GET"])
+def get_memory_report():
+    """Memory usage per subsystem, cache sizes and queue counts"""
+    # A tracemalloc snapshot is expensive; don't let anyone trigger it
+    if not admin_authorized():
+        return jsonify({"error": "Forbidden"}), 403
+    return jsonify(memory_registry.report(top=int(request.args.get("top", 10))))
+
+
+@app.route("/api/admin/freshness", methods=["GET"])
+def get_freshness_report():
+    """Stage latency percentiles from upstream fetch to SSE delivery"""
+    session_id = request.args.get("session_id")
+    return jsonify(freshness_tracker.summary(session_id))
+
+
 @app.route("/view")
 def view_all_sessions():
     """View all monitoring sessions"""
@@ -364,13 +796,22 @@ def view_all_sessions():
 @app.route("/view/<session_id>")
 def view_single_session(session_id):
     """View a specific monitoring session"""
-    session = db.get_session_by_id(session_id)
+    if frozen_archive.get(session_id) is not None:
+        return render_template("single_view.html", session_id=session_id)
+
+    session = db.get_session_by_id(session_id) or db.get_archived_session(session_id)
     if not session:
         return "Session not found. Please start monitoring from the home page."
 
     return render_template("single_view.html", session_id=session_id)
 
 
+@app.route("/view/tournament/<tournament_id>")
+def view_tournament_ranking(tournament_id):
+    """View all watched players in a tournament ranked together"""
+    return render_template("tournament_view.html", tournament_id=tournament_id)
+
+
 # Error handlers
 @app.errorhandler(404)
 def error404(error):
@@ -391,9 +832,6 @@ def main():
     port = int(os.environ.get("PORT", 8080))
     debug = os.environ.get("DEBUG", "False").lower() == "true"
 
-    # Restart existing sessions from database
-    restart_existing_sessions()
-
     print("=" * 70)
     print("♟️  Chess Tournament Monitor - Multi-Session")
     print("=" * 70)
@@ -403,10 +841,14 @@ def main():
     print(f"  • Web UI:          http://{host}:{port}/")
     print(f"  • View All:        http://{host}:{port}/view")
     print(f"  • Start monitor:   POST http://{host}:{port}/api/monitor")
+    print(f"  • Bulk import:     POST http://{host}:{port}/api/monitor/bulk")
     print(f"  • Get sessions:    GET http://{host}:{port}/api/sessions")
     print(f"  • Get status:      GET http://{host}:{port}/api/status/<id>")
     print(f"  • Live stream:     GET http://{host}:{port}/api/stream/<id>")
+    print(f"  • History:         GET http://{host}:{port}/api/history/<id>")
     print(f"  • Stop monitor:    POST http://{host}:{port}/api/stop/<id>")
+    print(f"  • Event ranking:   GET http://{host}:{port}/api/tournament/<tnr>/ranking")
+    print(f"  • Export:          GET http://{host}:{port}/api/export?format=csv")
     print("=" * 70)
     print("\nFeatures:")
     print(f"  ✓ Multi-player monitoring (max {MAX_SESSIONS} concurrent sessions)")
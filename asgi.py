@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Chess Tournament Monitor - Async (ASGI) entry point
+Serves the SSE stream and the session status routes on an event loop, so an
+idle subscriber costs a coroutine instead of a server thread; every other
+route runs on the Flask app through a small thread pool
+Run: uvicorn asgi:app --host 0.0.0.0 --port 8080
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Dict, Optional, Set
+from urllib.parse import parse_qs
+from a2wsgi import WSGIMiddleware
+import app as web
+from src.config import Config
+from src.services.freshness import freshness_tracker
+from src.services.frozen import frozen_archive, response_parts
+from src.services.memory import memory_registry
+
+HEARTBEAT_INTERVAL = 15  # seconds
+
+STREAM_ROUTE = re.compile(r"^/api/stream/([^/]+)$")
+STATUS_ROUTE = re.compile(r"^/api/status/([^/]+)$")
+
+
+class StreamHub:
+    """
+    Fans published events out to the async SSE streams of this process
+
+    Events arrive from update worker or IPC threads and are handed to the
+    event loop, where every open stream of the session has its own queue, so
+    several tabs watching one session all receive every event. A stream that
+    falls ``backlog`` events behind is closed; the browser reconnects with
+    Last-Event-ID and catches up from the journal.
+
+    Sessions monitored by another process are followed through the journal
+    instead, with one query per session however many streams it has.
+    """
+
+    def __init__(self, backlog: int):
+        self.backlog = backlog
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.streams: Dict[str, Set[asyncio.Queue]] = {}
+        # Newest seq handed to the streams of each session, and journal tails
+        self.last_seq: Dict[str, int] = {}
+        self.tails: Dict[str, asyncio.Task] = {}
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        """Deliver events on this loop from now on"""
+        self.loop = loop
+
+    def publish(self, session_id: str, data: dict):
+        """Hand an event to the loop (safe to call from any thread)"""
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._deliver, session_id, data)
+
+    def _deliver(self, session_id: str, data: dict):
+        """Queue an event for every stream of a session (runs on the loop)"""
+        streams = list(self.streams.get(session_id, ()))
+        if not streams:
+            return
+        seq = data.get("seq")
+        if seq is not None:
+            if seq <= self.last_seq.get(session_id, 0):
+                return
+            self.last_seq[session_id] = seq
+
+        # Serialized once, however many streams the session has
+        event = (data, web.format_sse(data))
+        for events in streams:
+            if events.qsize() >= self.backlog:
+                self.unsubscribe(session_id, events)
+                events.put_nowait(None)
+            else:
+                events.put_nowait(event)
+
+    def subscribe(self, session_id: str, since: int = 0) -> asyncio.Queue:
+        """
+        Open a queue of (data, SSE text) events; None means close
+
+        Args:
+            session_id: Session to follow
+            since: Journal seq the stream is up to date with
+        """
+        events = asyncio.Queue()
+        self.streams.setdefault(session_id, set()).add(events)
+        if session_id not in self.tails:
+            self.last_seq[session_id] = max(self.last_seq.get(session_id, 0), since)
+            self.tails[session_id] = asyncio.ensure_future(self._tail(session_id))
+        return events
+
+    async def _tail(self, session_id: str):
+        """Deliver journal entries while another process monitors the session"""
+        try:
+            while session_id in self.streams:
+                await asyncio.sleep(web.JOURNAL_POLL_INTERVAL)
+                if not web.monitored_elsewhere(session_id):
+                    continue
+                try:
+                    entries = await asyncio.to_thread(
+                        web.db.get_journal,
+                        session_id,
+                        after=self.last_seq.get(session_id, 0),
+                    )
+                except Exception as e:
+                    print(f"⚠️  Journal tail failed [{session_id}]: {e}")
+                    continue
+                for entry in entries:
+                    self._deliver(session_id, {**entry["data"], "seq": entry["seq"]})
+        finally:
+            self.tails.pop(session_id, None)
+            self.last_seq.pop(session_id, None)
+
+    def unsubscribe(self, session_id: str, events: asyncio.Queue):
+        """Stop delivering to a stream's queue"""
+        streams = self.streams.get(session_id)
+        if streams is not None:
+            streams.discard(events)
+            if not streams:
+                del self.streams[session_id]
+
+    def connections(self) -> int:
+        """Number of open streams"""
+        return sum(len(streams) for streams in list(self.streams.values()))
+
+
+_config = Config.from_env()
+hub = StreamHub(_config.sse_backlog)
+web.event_sink = hub.publish
+memory_registry.register_gauge("sse_streams", hub.connections)
+
+# Routes that stay synchronous (bulk start, export, admin, pages)
+flask_app = WSGIMiddleware(web.app, workers=_config.wsgi_threads)
+
+
+async def send_json(send, body: dict, status: int = 200):
+    """Send a complete JSON response"""
+    payload = json.dumps(body).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": payload})
+
+
+async def sessions_route(send):
+    """Get all active monitoring sessions"""
+    sessions = await asyncio.to_thread(web.db.get_all_sessions)
+    await send_json(
+        send, {"sessions": [web.session_summary(session) for session in sessions]}
+    )
+
+
+async def send_frozen(scope, send, frozen):
+    """Serve a frozen snapshot with its ETag and immutable cache headers"""
+    headers = dict(scope["headers"])
+    status, response_headers, body = response_parts(
+        frozen,
+        headers.get(b"if-none-match", b"").decode("latin1"),
+        headers.get(b"accept-encoding", b"").decode("latin1"),
+    )
+    response_headers["Content-Length"] = str(len(body))
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (name.lower().encode("latin1"), value.encode("latin1"))
+                for name, value in response_headers.items()
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def status_route(scope, send, session_id: str):
+    """Get current status of a specific monitoring session"""
+    # Finished sessions are served from their frozen snapshot
+    frozen = await asyncio.to_thread(frozen_archive.get, session_id)
+    if frozen is not None:
+        await send_frozen(scope, send, frozen)
+        return
+
+    session = await asyncio.to_thread(
+        web.db.get_session_by_id, session_id
+    ) or await asyncio.to_thread(web.db.get_archived_session, session_id)
+    if not session:
+        await send_json(send, {"error": "Session not found"}, 404)
+        return
+
+    frozen = await asyncio.to_thread(frozen_archive.freeze, session)
+    if frozen is not None:
+        await send_frozen(scope, send, frozen)
+        return
+    await send_json(send, web.session_status(session))
+
+
+# In-flight status lookups, shared by every stream of a session
+_status_checks: Dict[str, asyncio.Future] = {}
+
+
+async def session_finished(session_id: str) -> bool:
+    """Whether a session has ended, with one DB lookup per burst of events"""
+    check = _status_checks.get(session_id)
+    if check is None:
+        check = asyncio.ensure_future(
+            asyncio.to_thread(web.db.get_session_by_id, session_id)
+        )
+        _status_checks[session_id] = check
+        check.add_done_callback(lambda _: _status_checks.pop(session_id, None))
+    session = await asyncio.shield(check)
+    return bool(session) and session["status"] in ["finished", "error"]
+
+
+async def wait_for_disconnect(receive, events: asyncio.Queue):
+    """Close the stream once the client goes away"""
+    while (await receive())["type"] != "http.disconnect":
+        pass
+    events.put_nowait(None)
+
+
+async def stream_route(scope, receive, send, session_id: str):
+    """Server-Sent Events stream for real-time updates"""
+    session = await asyncio.to_thread(web.db.get_session_by_id, session_id)
+    if not session:
+        await send_json(send, {"error": "Session not found"}, 404)
+        return
+
+    # Resume point: sent by EventSource on reconnect, or given explicitly
+    headers = dict(scope["headers"])
+    resume_from = headers.get(b"last-event-id", b"").decode("latin1") or None
+    if resume_from is None:
+        query = parse_qs(scope["query_string"].decode("latin1"))
+        resume_from = query.get("since", [None])[0]
+    if resume_from is not None:
+        try:
+            resume_from = int(resume_from)
+        except ValueError:
+            await send_json(send, {"error": "Event ID must be an integer"}, 400)
+            return
+
+    # Live events from here on; older ones are only sent when resuming
+    latest_seq = await asyncio.to_thread(web.db.get_last_journal_seq, session_id)
+
+    # Subscribe before replaying so nothing published in between is lost
+    events = hub.subscribe(session_id, latest_seq)
+    watcher = asyncio.ensure_future(wait_for_disconnect(receive, events))
+
+    async def write(text: str):
+        await send(
+            {
+                "type": "http.response.body",
+                "body": text.encode("utf-8"),
+                "more_body": True,
+            }
+        )
+
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream; charset=utf-8"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                ],
+            }
+        )
+        await write(f'data: {{"type": "connected", "session_id": "{session_id}"}}\n\n')
+
+        # Replay what the client missed from the journal; live events may
+        # repeat some of it, so skip anything at or below the last replayed seq
+        last_seq = latest_seq
+        if resume_from is not None:
+            last_seq = resume_from
+            journal = await asyncio.to_thread(
+                web.db.get_journal, session_id, after=resume_from
+            )
+            for entry in journal:
+                entry["data"]["seq"] = entry["seq"]
+                await write(web.format_sse(entry["data"]))
+                last_seq = entry["seq"]
+
+        while True:
+            try:
+                event = await asyncio.wait_for(events.get(), HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                await write(": heartbeat\n\n")
+                continue
+
+            if event is None:
+                break
+            data, text = event
+            if data.get("seq") is not None:
+                if data["seq"] <= last_seq:
+                    continue
+                last_seq = data["seq"]
+            await write(text)
+
+            if data.get("trace"):
+                freshness_tracker.record(
+                    session_id,
+                    {
+                        "fetch_start": data["trace"]["fetch_start"],
+                        "sse_write": time.time(),
+                    },
+                    stages=["sse_write"],
+                )
+
+            # Check if session is finished
+            if await session_finished(session_id):
+                break
+
+        await send({"type": "http.response.body", "body": b""})
+    except OSError:
+        # Client disconnected mid-write
+        pass
+    finally:
+        watcher.cancel()
+        hub.unsubscribe(session_id, events)
+
+
+async def lifespan(receive, send):
+    """Bind the stream hub to the server's loop at startup"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            hub.bind(asyncio.get_running_loop())
+            print("⚡ Async serving ready")
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI application: async routes first, Flask for the rest"""
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+
+    if hub.loop is None:
+        # Servers started without lifespan support
+        hub.bind(asyncio.get_running_loop())
+
+    if scope["type"] == "http" and scope["method"] == "GET":
+        path = scope["path"]
+        match = STREAM_ROUTE.match(path)
+        if match:
+            await stream_route(scope, receive, send, match.group(1))
+            return
+        match = STATUS_ROUTE.match(path)
+        if match:
+            await status_route(scope, send, match.group(1))
+            return
+        if path == "/api/sessions":
+            await sessions_route(send)
+            return
+
+    await flask_app(scope, receive, send)
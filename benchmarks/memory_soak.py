@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Long-soak memory benchmark
+Runs many monitors against synthetic chess-results pages (no network) and
+samples RSS; fails if RSS keeps growing after warm-up
+Run: python benchmarks/memory_soak.py [--sessions 50] [--cycles 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.config import Config  # noqa: E402
+from src.services.monitor import TournamentMonitor  # noqa: E402
+from src.services.memory import current_rss, memory_registry  # noqa: E402
+from src.services.opponent_profiles import opponent_profiles  # noqa: E402
+
+ROUNDS = 11
+
+
+def player_page(snr: int, completed: int) -> bytes:
+    """Synthetic art=9 player page with ``completed`` results"""
+    rows = "".join(
+        f"<tr><td>{rd}</td><td>{rd}</td><td>{snr + rd}</td><td></td>"
+        f"<td>Opponent {snr + rd}</td><td>1800</td><td>IND</td><td></td>"
+        f"<td>{'1' if rd <= completed else ''}</td></tr>"
+        for rd in range(1, ROUNDS + 1)
+    )
+    return (
+        f"<html><body><a>Rd.{completed}/{ROUNDS}</a>"
+        f'<table class="CRs1"><tr><td>Name</td><td>Player {snr}</td></tr>'
+        f"<tr><td>Rank</td><td>{snr}</td></tr></table>"
+        f'<table class="CRs1"><tr><th>Rd.</th><th>Bo.</th><th>SNo</th><th></th>'
+        f"<th>Name</th><th>Rtg</th><th>FED</th><th>Pts.</th><th>Res.</th></tr>"
+        f"{rows}</table></body></html>"
+    ).encode()
+
+
+def round_page(players: int) -> bytes:
+    """Synthetic art=2 pairing page"""
+    rows = "".join(
+        f"<tr><td>{b}</td><td>{2 * b - 1}</td>"
+        + "<td></td>" * 9
+        + f"<td>{2 * b}</td></tr>"
+        for b in range(1, players // 2 + 1)
+    )
+    return f'<table class="CRs1"><tr><th>Bo.</th></tr>{rows}</table>'.encode()
+
+
+def standings_page(players: int) -> bytes:
+    """Synthetic art=1 standings page"""
+    rows = "".join(
+        f"<tr><td>{p}</td><td>{p}</td><td>Player {p}</td><td>3</td></tr>"
+        for p in range(1, players + 1)
+    )
+    return (
+        f'<table class="CRs1"><tr><td>Rk.</td><td>SNo</td><td>Name</td>'
+        f"<td>Pts.</td></tr>{rows}</table>"
+    ).encode()
+
+
+class SyntheticClient:
+    """Serves synthetic pages in place of chess-results.com"""
+
+    def __init__(self, config: Config, snr: int):
+        self.config = config
+        self.snr = snr
+        self.completed = 0
+
+    def fetch_player_html(self):
+        return player_page(self.snr, self.completed)
+
+    def fetch_round_html(self, round_num: int):
+        return round_page(200)
+
+    def fetch_standings_html(self):
+        return standings_page(200)
+
+
+def fill_profile(key, config):
+    """Fill the opponent profile cache inline instead of fetching"""
+    profile = {"rating": "1800", "federation": "IND", "title": None}
+    opponent_profiles._cache[key] = (time.monotonic(), profile)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--budget-mb", type=int, default=0)
+    parser.add_argument("--max-growth-mb", type=float, default=5.0)
+    args = parser.parse_args()
+
+    opponent_profiles._schedule = fill_profile
+    memory_registry.start(tracing=False, budget_mb=args.budget_mb, check_interval=1)
+
+    samples = []
+    start = time.perf_counter()
+    for cycle in range(args.cycles):
+        # Sessions come and go: every cycle builds fresh monitors and polls a
+        # whole tournament's worth of rounds through them
+        for session in range(args.sessions):
+            config = Config(tournament_id=f"tnr{session % 5}", player_snr=str(session))
+            client = SyntheticClient(config, session)
+            monitor = TournamentMonitor(config, client)
+            monitor._fetch_round_pages = lambda rounds: {
+                str(rd): client.fetch_round_html(rd) for rd in rounds
+            }
+            monitor._prefetch_round = lambda rd, m=monitor: (
+                m.prefetched_colors.__setitem__(str(rd), "White")
+            )
+            for completed in range(ROUNDS + 1):
+                client.completed = completed
+                tournament = monitor.fetch_current_state()
+                monitor.detect_changes(tournament)
+                monitor.update_state(tournament)
+
+        if cycle % max(1, args.cycles // 20) == 0 or cycle == args.cycles - 1:
+            rss_mb = current_rss() / (1024 * 1024)
+            samples.append(rss_mb)
+            print(f"cycle {cycle:5d}  rss {rss_mb:8.1f} MB")
+
+    elapsed = time.perf_counter() - start
+    polls = args.cycles * args.sessions * (ROUNDS + 1)
+    warm = samples[len(samples) // 4]
+    growth = samples[-1] - warm
+    print(f"{polls} polls in {elapsed:.1f}s ({polls / elapsed:.0f} polls/s)")
+    print(
+        f"RSS after warm-up {warm:.1f} MB, final {samples[-1]:.1f} MB, growth {growth:+.1f} MB"
+    )
+
+    if growth > args.max_growth_mb:
+        print("❌ RSS is not flat")
+        sys.exit(1)
+    print("✅ RSS is flat")
+
+
+if __name__ == "__main__":
+    main()
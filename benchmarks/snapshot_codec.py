@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Snapshot codec benchmark
+Compares plain JSON text with every registered snapshot codec on a long
+tournament: encode/decode time per snapshot and size per row on disk
+Run: python benchmarks/snapshot_codec.py [--rounds 13] [--rows 2000]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import snapshot_codec  # noqa: E402
+from src.models.match import Match  # noqa: E402
+from src.models.player import Player  # noqa: E402
+from src.models.tournament import Tournament  # noqa: E402
+from src.services.engine import serialize_tournament  # noqa: E402
+
+
+def long_tournament(rounds: int) -> dict:
+    """Serialized state of a finished tournament with every field filled in"""
+    player = Player(
+        name="Sample Player, Long Name",
+        snr="137",
+        starting_rank="137",
+        current_rank="42",
+        points=f"{rounds * 0.6:.1f}",
+        rating="2105",
+        k_factor="20",
+        rating_change=12.4,
+        tiebreaks={
+            "snr": "137",
+            "name": "Sample Player, Long Name",
+            "rating": 2105,
+            "points": rounds * 0.6,
+            "buchholz": 61.5,
+            "buchholz_cut1": 57.0,
+            "sonneborn_berger": 44.25,
+            "performance": 2188,
+        },
+    )
+    matches = [
+        Match(
+            round_number=str(rd),
+            board_number=str(40 + rd),
+            opponent_snr=str(200 + rd),
+            opponent_name=f"Opponent Number {rd}, Someone",
+            result=("1", "0.5", "0")[rd % 3],
+            pairing=f"137-{200 + rd}",
+            color="White" if rd % 2 else "Black",
+            opponent_rating=str(1900 + rd * 17),
+            opponent_federation="IND",
+            opponent_title="FM" if rd % 4 == 0 else None,
+            rating_change=(-6.3, 2.1, 7.9)[rd % 3],
+        )
+        for rd in range(1, rounds + 1)
+    ]
+    data = serialize_tournament(Tournament("123456", player, matches, rounds))
+    data["new_round"] = False
+    data["timestamp"] = "2026-01-01T12:00:00.000000"
+    return data
+
+
+def time_per_call(fn, arg, repeat: int) -> float:
+    """Mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def disk_size(values, binary: bool) -> int:
+    """Bytes used by a SQLite file holding one row per value"""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(path)
+        conn.execute(
+            f"CREATE TABLE t (id INTEGER PRIMARY KEY, v {'BLOB' if binary else 'TEXT'})"
+        )
+        conn.executemany("INSERT INTO t (v) VALUES (?)", ((v,) for v in values))
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+        return os.path.getsize(path)
+    finally:
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=13)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    data = long_tournament(args.rounds)
+    text = json.dumps(data)
+    text_disk = disk_size([text] * args.rows, binary=False)
+
+    print(f"{args.rounds}-round tournament, {args.rows} rows on disk\n")
+    print(f"{'codec':<14}{'bytes':>8}{'encode µs':>12}{'decode µs':>12}{'disk KB':>10}")
+    print(
+        f"{'json (text)':<14}{len(text):>8}"
+        f"{time_per_call(json.dumps, data, args.repeat):>12.1f}"
+        f"{time_per_call(json.loads, text, args.repeat):>12.1f}"
+        f"{text_disk / 1024:>10.0f}"
+    )
+
+    for name in snapshot_codec.available_codecs():
+        blob = snapshot_codec.encode(data, name)
+        assert snapshot_codec.decode(blob) == data
+        encode_us = time_per_call(
+            lambda d: snapshot_codec.encode(d, name), data, args.repeat
+        )
+        decode_us = time_per_call(snapshot_codec.decode, blob, args.repeat)
+        disk = disk_size([blob] * args.rows, binary=True)
+        print(
+            f"{name:<14}{len(blob):>8}{encode_us:>12.1f}{decode_us:>12.1f}"
+            f"{disk / 1024:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
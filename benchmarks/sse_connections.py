@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+SSE connection-scaling benchmark
+Starts the web tier (ASGI via uvicorn, or gunicorn for comparison) against a
+scratch database, opens many concurrent SSE streams, then measures
+/api/status latency and event fan-out while they stay open. Events come
+from a stand-in monitor daemon over IPC, so nothing touches the network.
+Run: python benchmarks/sse_connections.py [--streams 2000] [--server asgi]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import aiohttp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.database import Database  # noqa: E402
+from src.services.ipc import EventPublisher  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+SERVERS = {
+    "asgi": ["uvicorn", "asgi:app", "--log-level", "warning", "--port"],
+    "gunicorn": ["gunicorn", "app:app", "--workers", "2", "--threads", "4", "--bind"],
+}
+
+
+def server_rss_mb(pid: int) -> float:
+    """Resident memory of the server process and its workers"""
+    total = 0
+    pids = [pid] + [
+        int(child)
+        for child in subprocess.run(
+            ["pgrep", "-P", str(pid)], capture_output=True, text=True
+        ).stdout.split()
+    ]
+    for p in pids:
+        try:
+            with open(f"/proc/{p}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+        except FileNotFoundError:
+            pass
+    return total / 1024
+
+
+def percentiles(values: list) -> str:
+    """p50/p99/max of latencies in milliseconds"""
+    if not values:
+        return "n/a"
+    values = sorted(values)
+    p50 = values[len(values) // 2]
+    p99 = values[min(len(values) - 1, len(values) * 99 // 100)]
+    return (
+        f"p50 {p50 * 1000:.1f}ms  p99 {p99 * 1000:.1f}ms  max {values[-1] * 1000:.1f}ms"
+    )
+
+
+class Stream:
+    """One SSE subscriber recording when each event seq arrives"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.connected = asyncio.Event()
+        self.received = {}
+
+    async def run(self, http: aiohttp.ClientSession, base: str):
+        try:
+            async with http.get(f"{base}/api/stream/{self.session_id}") as resp:
+                async for line in resp.content:
+                    if not line.startswith(b"data: "):
+                        continue
+                    data = json.loads(line[6:])
+                    if data.get("type") == "connected":
+                        self.connected.set()
+                    elif "seq" in data:
+                        self.received[data["seq"]] = time.time()
+        except (aiohttp.ClientError, asyncio.CancelledError):
+            pass
+
+
+async def measure_status(http: aiohttp.ClientSession, base: str, session_id: str):
+    """Latencies of sequential /api/status requests (None on timeout)"""
+    latencies = []
+    for _ in range(20):
+        start = time.perf_counter()
+        try:
+            async with http.get(
+                f"{base}/api/status/{session_id}",
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                await resp.read()
+            latencies.append(time.perf_counter() - start)
+        except asyncio.TimeoutError:
+            return None
+    return latencies
+
+
+async def benchmark(
+    args, base: str, session_ids: list, publisher: EventPublisher, server_pid: int
+):
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=None)
+    ) as http:
+        rss_idle = server_rss_mb(server_pid)
+        baseline = await measure_status(http, base, session_ids[0])
+        print(f"/api/status, no streams:      {percentiles(baseline)}")
+
+        streams = [
+            Stream(session_ids[i % len(session_ids)]) for i in range(args.streams)
+        ]
+        tasks = [asyncio.ensure_future(s.run(http, base)) for s in streams]
+
+        start = time.perf_counter()
+        deadline = start + args.connect_timeout
+        while time.perf_counter() < deadline:
+            if all(s.connected.is_set() for s in streams):
+                break
+            await asyncio.sleep(0.1)
+        connected = sum(s.connected.is_set() for s in streams)
+        print(
+            f"Streams connected:            {connected}/{args.streams} "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+        loaded = await measure_status(http, base, session_ids[0])
+        print(
+            f"/api/status, {connected} streams: "
+            + (percentiles(loaded) if loaded is not None else "timed out")
+        )
+
+        print(
+            f"Server RSS:                   {rss_idle:.0f} MB idle, "
+            f"{server_rss_mb(server_pid):.0f} MB with streams open"
+        )
+
+        # Fan out events from the stand-in daemon and time their arrival
+        delivery = []
+        for seq in range(1, args.events + 1):
+            sent = time.time()
+            for session_id in session_ids:
+                publisher.publish(session_id, {"seq": seq, "timestamp": sent})
+            expected = [s for s in streams if s.connected.is_set()]
+            deadline = time.perf_counter() + 10
+            while time.perf_counter() < deadline:
+                if all(seq in s.received for s in expected):
+                    break
+                await asyncio.sleep(0.05)
+            delivery += [
+                s.received[seq] - sent
+                for s in streams
+                if s.connected.is_set() and seq in s.received
+            ]
+        print(
+            f"Events delivered:             {len(delivery)}/{connected * args.events}"
+            f"  {percentiles(delivery)}"
+        )
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--streams", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--events", type=int, default=5)
+    parser.add_argument("--server", choices=SERVERS, default="asgi")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--ipc-port", type=int, default=8799)
+    parser.add_argument("--connect-timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="sse-bench-")
+    database_url = f"sqlite:///{workdir}/sessions.db"
+    db = Database(database_url)
+    db.create_tables()
+    session_ids = [str(uuid.uuid4()) for _ in range(args.sessions)]
+    db.create_sessions(
+        [
+            (session_id, "https://s1.chess-results.com/tnr1.aspx", {"player_snr": "1"})
+            for session_id in session_ids
+        ]
+    )
+    for session_id in session_ids:
+        db.update_session(session_id, status="running")
+
+    ipc_address = f"127.0.0.1:{args.ipc_port}"
+    publisher = EventPublisher(ipc_address, "bench")
+    publisher.start()
+
+    address = str(args.port) if args.server == "asgi" else f"127.0.0.1:{args.port}"
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        MONITOR_MODE="external",
+        MONITOR_IPC_ADDRESS=ipc_address,
+        MONITOR_IPC_AUTHKEY="bench",
+    )
+    server = subprocess.Popen(SERVERS[args.server] + [address], cwd=ROOT, env=env)
+    base = f"http://127.0.0.1:{args.port}"
+
+    try:
+        # Wait for the server and for its IPC subscriber to connect
+        while not publisher.connections:
+            if server.poll() is not None:
+                sys.exit("❌ Server exited during startup")
+            time.sleep(0.2)
+        print(f"🚀 {args.server} server up (pid {server.pid})")
+
+        asyncio.run(benchmark(args, base, session_ids, publisher, server.pid))
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            # gunicorn waits for its stuck stream threads
+            server.kill()
+        publisher.close()
+
+
+if __name__ == "__main__":
+    main()
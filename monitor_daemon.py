@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Chess Tournament Monitor - Monitor Daemon
+Runs only the polling and parsing engine against the shared database and
+publishes updates over local IPC to web processes started with
+MONITOR_MODE=external
+Run: python monitor_daemon.py
+"""
+
+import argparse
+import signal
+import threading
+from src.config import Config
+from src.database import Database
+from src.services.engine import MonitorEngine, prune_tournament_caches
+from src.services.ipc import EventPublisher
+from src.services.memory import memory_registry
+from src.services.reaper import SessionReaper
+
+
+def main():
+    """Run the monitor daemon until SIGINT/SIGTERM"""
+    config = Config.from_env()
+
+    parser = argparse.ArgumentParser(description="Chess tournament monitor daemon")
+    parser.add_argument(
+        "--ipc-address",
+        default=config.ipc_address,
+        help="host:port or Unix socket path to publish updates on",
+    )
+    args = parser.parse_args()
+
+    db = Database()
+    db.create_tables()
+
+    engine = None
+
+    def on_command(command: dict):
+        """Handle commands sent by the web processes"""
+        if command["command"] == "rebalance":
+            engine.lease_manager.wake()
+        elif command["command"] == "stop":
+            engine.stop_session(command["session_id"])
+
+    publisher = EventPublisher(args.ipc_address, config.ipc_authkey, on_command)
+    # Created before any other thread starts: it forks the parse processes
+    engine = MonitorEngine(db, publish=publisher.publish)
+
+    memory_registry.start(
+        config.memory_tracing, config.memory_budget_mb, config.memory_check_interval
+    )
+
+    # The tournament-wide caches live here, with the monitors
+    reaper = SessionReaper(
+        db,
+        retention_hours=config.session_retention_hours,
+        archive_retention_days=config.archive_retention_days,
+        interval=config.reaper_interval,
+        vacuum_interval=config.vacuum_interval,
+    )
+    reaper.add_cleanup(lambda live: prune_tournament_caches(db.get_live_tournaments()))
+
+    shutdown = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: shutdown.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: shutdown.set())
+
+    print("=" * 70)
+    print("♟️  Chess Tournament Monitor - Monitor Daemon")
+    print("=" * 70)
+    print(f"Owner ID: {engine.lease_manager.owner_id}")
+    print("=" * 70)
+
+    publisher.start()
+    engine.start()
+    reaper.start()
+
+    shutdown.wait()
+
+    print("\n⏹️  Shutting down monitor daemon...")
+    reaper.stop()
+    engine.stop()
+    memory_registry.stop()
+    publisher.close()
+    print("✅ Monitor daemon stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Async HTTP client for chess-results.com API
+"""
+
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup
+from typing import Dict, List, Optional
+from ..config import Config
+
+
+class AsyncChessResultsClient:
+    """Async HTTP client that fetches several chess-results.com pages at once"""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the underlying aiohttp session on first use"""
+        if self.session is None or self.session.closed:
+            connector_args = {"limit": self.config.max_concurrent_requests}
+            if not self.config.verify_ssl:
+                # chess-results.com has SSL issues
+                connector_args["ssl"] = False
+            connector = aiohttp.TCPConnector(**connector_args)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def fetch_player_page(self) -> Optional[BeautifulSoup]:
+        """Fetch and parse the player's tournament page"""
+        url = self.config.get_player_url()
+        return await self._fetch_and_parse(url)
+
+    async def fetch_round_page(self, round_num: int) -> Optional[BeautifulSoup]:
+        """Fetch and parse a specific round's pairing page"""
+        url = self.config.get_round_url(round_num)
+        return await self._fetch_and_parse(url)
+
+    async def fetch_round_pages(
+        self, round_nums: List[int]
+    ) -> Dict[int, Optional[BeautifulSoup]]:
+        """Fetch and parse several round pairing pages concurrently"""
+        urls = [self.config.get_round_url(round_num) for round_num in round_nums]
+        soups = await self.fetch_many(urls)
+        return dict(zip(round_nums, soups))
+
+    async def fetch_round_htmls(
+        self, round_nums: List[int]
+    ) -> Dict[int, Optional[bytes]]:
+        """Fetch the raw HTML of several round pairing pages concurrently"""
+        urls = [self.config.get_round_url(round_num) for round_num in round_nums]
+        htmls = await self.fetch_many(urls, parse=False)
+        return dict(zip(round_nums, htmls))
+
+    async def fetch_many(self, urls: List[str], parse: bool = True) -> list:
+        """
+        Fetch several URLs concurrently
+
+        At most ``config.max_concurrent_requests`` requests are in flight at
+        once and each one is bounded by ``config.request_timeout``. Results
+        are returned in the same order as ``urls`` as parsed BeautifulSoup
+        objects (or raw bytes when ``parse`` is False); failed fetches are
+        None. If the caller is cancelled, all outstanding requests are
+        cancelled too.
+        """
+        fetch = self._fetch_and_parse if parse else self._fetch
+        tasks = [asyncio.ensure_future(fetch(url)) for url in urls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _fetch_and_parse(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch URL and return parsed BeautifulSoup object"""
+        html = await self._fetch(url)
+        return BeautifulSoup(html, "html.parser") if html else None
+
+    async def _fetch(self, url: str) -> Optional[bytes]:
+        """Fetch URL and return the raw response body"""
+        session = await self._get_session()
+        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout)
+        async with self._semaphore:
+            try:
+                async with session.get(url, timeout=timeout) as response:
+                    if response.status == 200:
+                        return await response.read()
+                    else:
+                        print(f"⚠️  Failed to fetch page: HTTP {response.status}")
+                        return None
+            except asyncio.TimeoutError:
+                print(f"⚠️  Request timeout after {self.config.request_timeout}s")
+                return None
+            except aiohttp.ClientConnectionError:
+                print("⚠️  Connection error - check your internet connection")
+                return None
+            except aiohttp.ClientError as e:
+                print(f"❌ Network error: {e}")
+                return None
+
+    async def close(self):
+        """Close the session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -8,6 +8,7 @@ from urllib3.exceptions import InsecureRequestWarning
 from bs4 import BeautifulSoup
 from typing import Optional
 from ..config import Config
+from ..services.cancellation import CancellationToken
 
 # Suppress SSL warnings for chess-results.com
 warnings.simplefilter("ignore", InsecureRequestWarning)
@@ -16,10 +17,17 @@ warnings.simplefilter("ignore", InsecureRequestWarning)
 class ChessResultsClient:
     """HTTP client for fetching data from chess-results.com"""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, token: Optional[CancellationToken] = None):
         self.config = config
         self.session = requests.Session()
         self.session.verify = config.verify_ssl
+        # Once cancelled, no new requests are sent and pooled connections close
+        self.token = token
+        if token is not None:
+            token.on_cancel(self.session.close)
+        # Whether the last fetch failed because the host itself didn't answer
+        # (timeout, connection error, 5xx or 429), as opposed to a bad page
+        self.host_unavailable = False
 
     def fetch_player_page(self) -> Optional[BeautifulSoup]:
         """Fetch and parse the player's tournament page"""
@@ -31,20 +39,54 @@ class ChessResultsClient:
         url = self.config.get_round_url(round_num)
         return self._fetch_and_parse(url)
 
+    def fetch_standings_page(self) -> Optional[BeautifulSoup]:
+        """Fetch and parse the tournament's current standings page"""
+        url = self.config.get_standings_url()
+        return self._fetch_and_parse(url)
+
+    def fetch_player_html(self) -> Optional[bytes]:
+        """Fetch the raw HTML of the player's tournament page"""
+        return self._fetch(self.config.get_player_url())
+
+    def fetch_profile_html(self, snr: str) -> Optional[bytes]:
+        """Fetch the raw HTML of another player's tournament page"""
+        return self._fetch(self.config.get_player_url(snr))
+
+    def fetch_round_html(self, round_num: int) -> Optional[bytes]:
+        """Fetch the raw HTML of a specific round's pairing page"""
+        return self._fetch(self.config.get_round_url(round_num))
+
+    def fetch_standings_html(self) -> Optional[bytes]:
+        """Fetch the raw HTML of the tournament's current standings page"""
+        return self._fetch(self.config.get_standings_url())
+
     def _fetch_and_parse(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch URL and return parsed BeautifulSoup object"""
+        html = self._fetch(url)
+        return BeautifulSoup(html, "html.parser") if html else None
+
+    def _fetch(self, url: str) -> Optional[bytes]:
+        """Fetch URL and return the raw response body"""
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        self.host_unavailable = False
         try:
             response = self.session.get(url, timeout=self.config.request_timeout)
             if response.status_code == 200:
-                return BeautifulSoup(response.text, "html.parser")
+                return response.content
             else:
                 print(f"⚠️  Failed to fetch page: HTTP {response.status_code}")
+                self.host_unavailable = (
+                    response.status_code >= 500 or response.status_code == 429
+                )
                 return None
         except requests.exceptions.Timeout:
             print(f"⚠️  Request timeout after {self.config.request_timeout}s")
+            self.host_unavailable = True
             return None
         except requests.exceptions.ConnectionError:
             print("⚠️  Connection error - check your internet connection")
+            self.host_unavailable = True
             return None
         except requests.exceptions.RequestException as e:
             print(f"❌ Network error: {e}")
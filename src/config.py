@@ -14,8 +14,61 @@ class Config:
     # API Settings
     check_interval: int = 30  # seconds between checks (increased from 5)
     request_timeout: int = 10  # seconds
+    max_concurrent_requests: int = 4  # parallel round page fetches per poll
     verify_ssl: bool = False  # chess-results.com has SSL issues
 
+    # Failure Handling
+    max_backoff: int = 600  # seconds, cap for exponential backoff
+    breaker_failure_threshold: int = 5  # failures before a host is skipped
+    breaker_reset_timeout: int = 60  # seconds before probing a failed host
+
+    # Parsing
+    parse_workers: int = 0  # processes for HTML parsing; 0 parses in-thread
+    parse_queue_size: int = 64  # pages waiting for a parse process at most
+
+    # Update Processing
+    update_workers: int = 2  # threads applying DB writes and SSE puts
+    update_queue_size: int = 100  # pending updates per worker before backpressure
+
+    # Session Leasing
+    lease_seconds: int = 60  # lease lifetime; renewed every third of it
+
+    # Process Layout
+    monitor_mode: str = "embedded"  # "embedded" or "external" (monitor daemon)
+    ipc_address: str = "127.0.0.1:8765"  # host:port or Unix socket path(s)
+    ipc_authkey: str = ""  # shared secret, required for the daemon channel
+
+    # Memory
+    memory_tracing: bool = False  # tracemalloc per-subsystem accounting
+    memory_budget_mb: int = 0  # evict caches above this RSS; 0 = unlimited
+    memory_check_interval: int = 30  # seconds between budget checks
+    admin_token: str = ""  # required by /api/admin/memory; unset disables it
+
+    # Opponent Profiles
+    profile_ttl: int = 21600  # seconds before an opponent's rating is refetched
+    profile_cache_size: int = 5000  # max cached opponent profiles
+    profile_workers: int = 2  # threads filling the profile cache
+
+    # Event Journal
+    journal_keep: int = 100  # events kept per session before compacting into a snapshot
+
+    # Retention
+    session_retention_hours: int = 24  # finished sessions stay live this long
+    archive_retention_days: int = 180  # archived sessions kept; 0 = forever
+    reaper_interval: int = 3600  # seconds between archive/cleanup passes
+    vacuum_interval: int = 86400  # seconds between VACUUMs after deletes
+
+    # Frozen Snapshots
+    frozen_dir: str = "data/frozen"  # immutable snapshots of finished sessions
+    frozen_cache_size: int = 256  # frozen snapshots kept in memory
+
+    # Freshness
+    freshness_alert_seconds: float = 0  # warn when fetch-to-delivery exceeds this
+
+    # Async Serving (asgi.py)
+    wsgi_threads: int = 16  # threads running the Flask routes that aren't async
+    sse_backlog: int = 256  # undelivered events before a slow stream is closed
+
     # Display Settings
     show_progress_dots: bool = True
     use_emojis: bool = True
@@ -32,17 +85,80 @@ class Config:
         return cls(
             check_interval=int(os.getenv("CHECK_INTERVAL", 30)),
             request_timeout=int(os.getenv("REQUEST_TIMEOUT", 10)),
+            max_concurrent_requests=int(os.getenv("MAX_CONCURRENT_REQUESTS", 4)),
             verify_ssl=os.getenv("VERIFY_SSL", "false").lower() == "true",
+            max_backoff=int(os.getenv("MAX_BACKOFF", 600)),
+            breaker_failure_threshold=int(os.getenv("BREAKER_FAILURE_THRESHOLD", 5)),
+            breaker_reset_timeout=int(os.getenv("BREAKER_RESET_TIMEOUT", 60)),
+            parse_workers=int(os.getenv("PARSE_WORKERS", 0)),
+            parse_queue_size=int(os.getenv("PARSE_QUEUE_SIZE", 64)),
+            update_workers=int(os.getenv("UPDATE_WORKERS", 2)),
+            update_queue_size=int(os.getenv("UPDATE_QUEUE_SIZE", 100)),
+            lease_seconds=int(os.getenv("LEASE_SECONDS", 60)),
+            monitor_mode=os.getenv("MONITOR_MODE", "embedded").lower(),
+            ipc_address=os.getenv("MONITOR_IPC_ADDRESS", "127.0.0.1:8765"),
+            ipc_authkey=os.getenv("MONITOR_IPC_AUTHKEY", ""),
+            memory_tracing=os.getenv("MEMORY_TRACING", "false").lower() == "true",
+            memory_budget_mb=int(os.getenv("MEMORY_BUDGET_MB", 0)),
+            memory_check_interval=int(os.getenv("MEMORY_CHECK_INTERVAL", 30)),
+            admin_token=os.getenv("ADMIN_TOKEN", ""),
+            profile_ttl=int(os.getenv("PROFILE_TTL", 21600)),
+            profile_cache_size=int(os.getenv("PROFILE_CACHE_SIZE", 5000)),
+            profile_workers=int(os.getenv("PROFILE_WORKERS", 2)),
+            journal_keep=int(os.getenv("JOURNAL_KEEP", 100)),
+            session_retention_hours=int(os.getenv("SESSION_RETENTION_HOURS", 24)),
+            archive_retention_days=int(os.getenv("ARCHIVE_RETENTION_DAYS", 180)),
+            reaper_interval=int(os.getenv("REAPER_INTERVAL", 3600)),
+            vacuum_interval=int(os.getenv("VACUUM_INTERVAL", 86400)),
+            frozen_dir=os.getenv("FROZEN_DIR", "data/frozen"),
+            frozen_cache_size=int(os.getenv("FROZEN_CACHE_SIZE", 256)),
+            freshness_alert_seconds=float(os.getenv("FRESHNESS_ALERT_SECONDS", 0)),
+            wsgi_threads=int(os.getenv("WSGI_THREADS", 16)),
+            sse_backlog=int(os.getenv("SSE_BACKLOG", 256)),
             show_progress_dots=os.getenv("SHOW_PROGRESS_DOTS", "true").lower()
             == "true",
             use_emojis=os.getenv("USE_EMOJIS", "true").lower() == "true",
         )
 
-    def get_player_url(self) -> str:
-        """Construct the player URL"""
+    @classmethod
+    def from_session(cls, session_config: dict, check_interval=None) -> "Config":
+        """Create config for a session from a parsed URL or stored session config"""
+        config = cls.from_env()
+        config.tournament_id = session_config["tournament_id"]
+        config.player_snr = session_config["player_snr"]
+        config.server = session_config["server"]
+        config.federation = session_config["federation"]
+        check_interval = check_interval or session_config.get("check_interval")
+        if check_interval:
+            config.check_interval = int(check_interval)
+        return config
+
+    def to_session_dict(self) -> dict:
+        """Extract the per-session settings that are persisted with a session"""
+        return {
+            "tournament_id": self.tournament_id,
+            "player_snr": self.player_snr,
+            "server": self.server,
+            "federation": self.federation,
+            "check_interval": self.check_interval,
+        }
+
+    def get_host(self) -> str:
+        """Get the chess-results server host name"""
+        return f"{self.server}.chess-results.com"
+
+    def get_player_url(self, snr: Optional[str] = None) -> str:
+        """Construct the player URL (another player's when ``snr`` is given)"""
+        return (
+            f"https://{self.server}.chess-results.com/{self.tournament_id}.aspx?"
+            f"lan=1&art=9&fed={self.federation}&snr={snr or self.player_snr}&SNode=S0"
+        )
+
+    def get_standings_url(self) -> str:
+        """Construct the current standings (ranking list) URL"""
         return (
             f"https://{self.server}.chess-results.com/{self.tournament_id}.aspx?"
-            f"lan=1&art=9&fed={self.federation}&snr={self.player_snr}&SNode=S0"
+            f"lan=1&art=1&fed={self.federation}"
         )
 
     def get_round_url(self, round_num: int) -> str:
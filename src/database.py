@@ -4,14 +4,38 @@ Database module for persisting tournament sessions
 
 import os
 import json
-from datetime import datetime
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Boolean
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import (
+    create_engine,
+    inspect,
+    text,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+    exists,
+    Column,
+    String,
+    DateTime,
+    Text,
+    Boolean,
+    Integer,
+    Index,
+    LargeBinary,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import aliased, sessionmaker
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+from . import snapshot_codec
+from .parsers.url_parser import player_key
 
 Base = declarative_base()
 
+# Retries when concurrent writers race for a session's next journal seq
+JOURNAL_APPEND_ATTEMPTS = 5
+
 
 class Session(Base):
     """Database model for monitoring sessions"""
@@ -24,8 +48,87 @@ class Session(Base):
     status = Column(String, default="starting")
     created_at = Column(DateTime, default=datetime.now)
     last_update = Column(DateTime, nullable=True)
-    data = Column(Text, nullable=True)  # JSON string
+    data = Column(Text, nullable=True)  # JSON string (rows not yet migrated)
+    snapshot = Column(LargeBinary, nullable=True)  # see snapshot_codec.py
+    error = Column(String, nullable=True)
+
+    # Monitor ownership lease (UTC timestamps, comparable across hosts); all
+    # sessions of a player are leased together, see lease_key()
+    player_key = Column(String, nullable=True, index=True)
+    owner_id = Column(String, nullable=True, index=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+
+class MonitorOwner(Base):
+    """Database model for live monitor processes taking part in leasing"""
+
+    __tablename__ = "monitor_owners"
+
+    id = Column(String, primary_key=True)
+    heartbeat_at = Column(DateTime, nullable=False)
+
+
+class HistoryEvent(Base):
+    """Database model for the append-only history of detected changes"""
+
+    __tablename__ = "history"
+    __table_args__ = (Index("ix_history_session_time", "session_id", "recorded_at"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(String, nullable=False)
+    recorded_at = Column(DateTime, nullable=False, index=True)
+    event_type = Column(String, nullable=False)  # "result", "rank" or "pairing"
+    round_number = Column(String, nullable=True)
+    value = Column(String, nullable=True)
+    previous = Column(String, nullable=True)
+    details = Column(Text, nullable=True)  # JSON string
+
+
+class JournalEntry(Base):
+    """Database model for the durable, ordered journal of published events"""
+
+    __tablename__ = "event_journal"
+
+    session_id = Column(String, primary_key=True)
+    seq = Column(Integer, primary_key=True, autoincrement=False)
+    recorded_at = Column(DateTime, nullable=False)
+    kind = Column(String, nullable=False)  # "update", "error" or "snapshot"
+    data = Column(Text, nullable=False)  # JSON string
+
+
+class ArchivedSession(Base):
+    """Database model for finished sessions moved out of the live tables"""
+
+    __tablename__ = "archived_sessions"
+
+    id = Column(String, primary_key=True)
+    url = Column(String, nullable=False)
+    config = Column(Text, nullable=False)  # JSON string
+    status = Column(String, nullable=False)  # "finished" or "error"
+    created_at = Column(DateTime, nullable=True)
+    last_update = Column(DateTime, nullable=True)
     error = Column(String, nullable=True)
+    archived_at = Column(DateTime, nullable=False, index=True)
+    # Final data and full history in one blob, see snapshot_codec.py
+    snapshot = Column(LargeBinary, nullable=False)
+
+
+def load_snapshot(session):
+    """Tournament data of a session row, from whichever column holds it"""
+    if session.snapshot:
+        return snapshot_codec.decode(session.snapshot)
+    return json.loads(session.data) if session.data else None
+
+
+def lease_key(config: dict) -> str:
+    """The player a session watches, as stored in ``Session.player_key``"""
+    return "/".join(str(part) for part in player_key({"federation": None, **config}))
+
+
+def utcnow():
+    """Naive UTC timestamp used for lease bookkeeping"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class Database:
@@ -46,6 +149,9 @@ class Database:
 
     def create_tables(self):
         """Create all tables if they don't exist"""
+        # Snapshots are first encoded on the update workers, where errors are
+        # only logged; refuse to start with a codec that can't write them
+        snapshot_codec.check_default_codec()
         try:
             Base.metadata.create_all(self.engine, checkfirst=True)
         except OperationalError as e:
@@ -53,6 +159,113 @@ class Database:
             # racing to create tables. Safe to ignore.
             if "already exists" not in str(e):
                 raise
+        self._enable_wal()
+        self._add_missing_columns()
+        self._fill_player_keys()
+        self.migrate_snapshots()
+
+    def _enable_wal(self):
+        """
+        Switch SQLite to write-ahead logging, so readers in other processes
+        don't block the writer (the mode is stored in the database file)
+        """
+        if self.engine.dialect.name != "sqlite":
+            return
+        try:
+            with self.engine.connect() as conn:
+                conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+                conn.execute(text("PRAGMA journal_mode=WAL"))
+        except OperationalError as e:
+            # Another worker is switching it at the same time
+            if "locked" not in str(e):
+                raise
+
+    def _add_missing_columns(self):
+        """Add columns introduced after a table was first created"""
+        existing = {
+            table: {
+                column["name"] for column in inspect(self.engine).get_columns(table)
+            }
+            for table in Base.metadata.tables
+        }
+        for table_name, table in Base.metadata.tables.items():
+            for column in table.columns:
+                if column.name in existing[table_name]:
+                    continue
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                try:
+                    with self.engine.begin() as conn:
+                        conn.execute(
+                            text(
+                                f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column_type}"
+                            )
+                        )
+                except (OperationalError, ProgrammingError) as e:
+                    # Another worker added it first
+                    message = str(e).lower()
+                    if (
+                        "duplicate column" not in message
+                        and "already exists" not in message
+                    ):
+                        raise
+
+            # Indexes on added columns (create_all only indexes new tables)
+            for index in table.indexes:
+                try:
+                    index.create(self.engine, checkfirst=True)
+                except (OperationalError, ProgrammingError) as e:
+                    if "already exists" not in str(e).lower():
+                        raise
+
+    def _fill_player_keys(self, batch_size=200):
+        """Set the lease key of sessions created before it was stored"""
+        while True:
+            db = self.get_session()
+            try:
+                rows = (
+                    db.query(Session)
+                    .filter(Session.player_key.is_(None))
+                    .limit(batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+                for row in rows:
+                    row.player_key = lease_key(json.loads(row.config))
+                db.commit()
+            finally:
+                db.close()
+
+    def migrate_snapshots(self, batch_size=200):
+        """
+        Re-encode JSON ``data`` rows with the snapshot codec
+
+        Runs in batches so a large table never sits in memory at once; rows
+        are also migrated one by one as they are next updated.
+        """
+        migrated = 0
+        while True:
+            db = self.get_session()
+            try:
+                rows = (
+                    db.query(Session)
+                    .filter(Session.data.isnot(None), Session.snapshot.is_(None))
+                    .limit(batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+                for row in rows:
+                    row.snapshot = snapshot_codec.encode(json.loads(row.data))
+                    row.data = None
+                db.commit()
+                migrated += len(rows)
+            finally:
+                db.close()
+
+        if migrated:
+            print(f"📦 Migrated {migrated} session snapshots to binary encoding")
+        return migrated
 
     def get_session(self):
         """Get a database session"""
@@ -66,6 +279,7 @@ class Database:
                 id=session_id,
                 url=url,
                 config=json.dumps(config),
+                player_key=lease_key(config),
                 status="starting",
                 created_at=datetime.now(),
             )
@@ -75,6 +289,36 @@ class Database:
         finally:
             db.close()
 
+    def create_sessions(self, sessions):
+        """
+        Create several monitoring sessions in a single transaction
+
+        Args:
+            sessions: Iterable of (session_id, url, config) tuples
+        """
+        db = self.get_session()
+        try:
+            now = datetime.now()
+            db.add_all(
+                [
+                    Session(
+                        id=session_id,
+                        url=url,
+                        config=json.dumps(config),
+                        player_key=lease_key(config),
+                        status="starting",
+                        created_at=now,
+                    )
+                    for session_id, url, config in sessions
+                ]
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
     def get_all_sessions(self):
         """Get all active sessions"""
         db = self.get_session()
@@ -88,7 +332,7 @@ class Database:
                     "status": s.status,
                     "created_at": s.created_at,
                     "last_update": s.last_update,
-                    "data": json.loads(s.data) if s.data else None,
+                    "data": load_snapshot(s),
                     "error": s.error,
                 }
                 for s in sessions
@@ -96,6 +340,104 @@ class Database:
         finally:
             db.close()
 
+    def iter_sessions(
+        self,
+        tournament_id=None,
+        status=None,
+        since=None,
+        until=None,
+        batch_size=500,
+        include_archived=False,
+    ):
+        """
+        Stream sessions from a server-side cursor, optionally filtered
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat no
+        matter how many sessions match. ``since``/``until`` bound the last
+        update time. With ``include_archived``, archived sessions follow the
+        live ones, marked by their "archived_at".
+        """
+        started_at = datetime.now()
+        db = self.get_session()
+        try:
+            query = db.query(Session)
+            if tournament_id is not None:
+                # Narrow in SQL; the exact match is checked on the parsed config
+                query = query.filter(Session.config.contains(f'"{tournament_id}"'))
+            if status is not None:
+                query = query.filter(Session.status == status)
+            if since is not None:
+                query = query.filter(Session.last_update >= since)
+            if until is not None:
+                query = query.filter(Session.last_update <= until)
+            query = (
+                query.order_by(Session.created_at)
+                .execution_options(stream_results=True)
+                .yield_per(batch_size)
+            )
+
+            for s in query:
+                config = json.loads(s.config)
+                if tournament_id is not None:
+                    if config.get("tournament_id") != tournament_id:
+                        continue
+                yield {
+                    "id": s.id,
+                    "url": s.url,
+                    "config": config,
+                    "status": s.status,
+                    "created_at": s.created_at,
+                    "last_update": s.last_update,
+                    "data": load_snapshot(s),
+                    "error": s.error,
+                }
+        finally:
+            db.close()
+
+        if not include_archived:
+            return
+
+        # Sessions archived since the live rows were read were already yielded
+        db = self.get_session()
+        try:
+            query = db.query(ArchivedSession).filter(
+                ArchivedSession.archived_at < started_at
+            )
+            if tournament_id is not None:
+                query = query.filter(
+                    ArchivedSession.config.contains(f'"{tournament_id}"')
+                )
+            if status is not None:
+                query = query.filter(ArchivedSession.status == status)
+            if since is not None:
+                query = query.filter(ArchivedSession.last_update >= since)
+            if until is not None:
+                query = query.filter(ArchivedSession.last_update <= until)
+            query = (
+                query.order_by(ArchivedSession.created_at)
+                .execution_options(stream_results=True)
+                .yield_per(batch_size)
+            )
+
+            for s in query:
+                config = json.loads(s.config)
+                if tournament_id is not None:
+                    if config.get("tournament_id") != tournament_id:
+                        continue
+                yield {
+                    "id": s.id,
+                    "url": s.url,
+                    "config": config,
+                    "status": s.status,
+                    "created_at": s.created_at,
+                    "last_update": s.last_update,
+                    "data": snapshot_codec.decode(s.snapshot)["data"],
+                    "error": s.error,
+                    "archived_at": s.archived_at,
+                }
+        finally:
+            db.close()
+
     def get_session_by_id(self, session_id):
         """Get a specific session"""
         db = self.get_session()
@@ -110,7 +452,7 @@ class Database:
                 "status": session.status,
                 "created_at": session.created_at,
                 "last_update": session.last_update,
-                "data": json.loads(session.data) if session.data else None,
+                "data": load_snapshot(session),
                 "error": session.error,
             }
         finally:
@@ -125,9 +467,13 @@ class Database:
                 return False
 
             for key, value in kwargs.items():
-                if key == "data" and value is not None:
-                    value = json.dumps(value)
-                elif key == "config" and value is not None:
+                if key == "data":
+                    session.snapshot = (
+                        snapshot_codec.encode(value) if value is not None else None
+                    )
+                    session.data = None
+                    continue
+                if key == "config" and value is not None:
                     value = json.dumps(value)
                 setattr(session, key, value)
 
@@ -137,14 +483,553 @@ class Database:
             db.close()
 
     def delete_session(self, session_id):
-        """Delete a session"""
+        """Delete a session, its history and its event journal"""
         db = self.get_session()
         try:
             session = db.query(Session).filter(Session.id == session_id).first()
             if session:
                 db.delete(session)
+                db.query(HistoryEvent).filter(
+                    HistoryEvent.session_id == session_id
+                ).delete(synchronize_session=False)
+                db.query(JournalEntry).filter(
+                    JournalEntry.session_id == session_id
+                ).delete(synchronize_session=False)
                 db.commit()
                 return True
             return False
         finally:
             db.close()
+
+    def get_session_ids(self):
+        """IDs of every session in the live table"""
+        db = self.get_session()
+        try:
+            return {row.id for row in db.query(Session.id)}
+        finally:
+            db.close()
+
+    def get_live_tournaments(self):
+        """(server, tournament_id) of every tournament with a live session"""
+        db = self.get_session()
+        try:
+            tournaments = set()
+            for row in db.query(Session.config):
+                config = json.loads(row.config)
+                tournaments.add((config.get("server"), config.get("tournament_id")))
+            return tournaments
+        finally:
+            db.close()
+
+    def archive_sessions(self, older_than, batch_size=100):
+        """
+        Move finished and failed sessions last updated before ``older_than``
+        to the archive, together with their history; their journal is dropped
+
+        Several processes may archive at once: whoever deletes the live row
+        writes the archive row, in the same transaction.
+
+        Returns:
+            list: IDs of the sessions archived by this call
+        """
+        db = self.get_session()
+        try:
+            candidates = [
+                row.id
+                for row in db.query(Session.id)
+                .filter(
+                    Session.status.in_(["finished", "error"]),
+                    func.coalesce(Session.last_update, Session.created_at) < older_than,
+                )
+                .limit(batch_size)
+            ]
+        finally:
+            db.close()
+
+        archived = []
+        for session_id in candidates:
+            db = self.get_session()
+            try:
+                session = db.query(Session).filter(Session.id == session_id).first()
+                if session is None:
+                    continue
+                history = [
+                    {
+                        "recorded_at": e.recorded_at.isoformat(),
+                        "type": e.event_type,
+                        "round": e.round_number,
+                        "value": e.value,
+                        "previous": e.previous,
+                        "details": json.loads(e.details) if e.details else None,
+                    }
+                    for e in db.query(HistoryEvent)
+                    .filter(HistoryEvent.session_id == session_id)
+                    .order_by(HistoryEvent.recorded_at, HistoryEvent.id)
+                ]
+                archive = ArchivedSession(
+                    id=session.id,
+                    url=session.url,
+                    config=session.config,
+                    status=session.status,
+                    created_at=session.created_at,
+                    last_update=session.last_update,
+                    error=session.error,
+                    archived_at=datetime.now(),
+                    snapshot=snapshot_codec.encode(
+                        {"data": load_snapshot(session), "history": history}
+                    ),
+                )
+
+                deleted = (
+                    db.query(Session)
+                    .filter(Session.id == session_id, Session.status == session.status)
+                    .delete(synchronize_session=False)
+                )
+                if not deleted:
+                    # Archived by another process, or restarted meanwhile
+                    db.rollback()
+                    continue
+                db.query(HistoryEvent).filter(
+                    HistoryEvent.session_id == session_id
+                ).delete(synchronize_session=False)
+                db.query(JournalEntry).filter(
+                    JournalEntry.session_id == session_id
+                ).delete(synchronize_session=False)
+                db.add(archive)
+                db.commit()
+                archived.append(session_id)
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+        return archived
+
+    def get_archived_session(self, session_id):
+        """Get an archived session, with its final data and history"""
+        db = self.get_session()
+        try:
+            session = (
+                db.query(ArchivedSession)
+                .filter(ArchivedSession.id == session_id)
+                .first()
+            )
+            if not session:
+                return None
+            archive = snapshot_codec.decode(session.snapshot)
+            return {
+                "id": session.id,
+                "url": session.url,
+                "config": json.loads(session.config),
+                "status": session.status,
+                "created_at": session.created_at,
+                "last_update": session.last_update,
+                "data": archive["data"],
+                "error": session.error,
+                "archived_at": session.archived_at,
+                "history": archive["history"],
+            }
+        finally:
+            db.close()
+
+    def purge_archive(self, older_than):
+        """Delete sessions archived before ``older_than``; returns how many"""
+        db = self.get_session()
+        try:
+            purged = (
+                db.query(ArchivedSession)
+                .filter(ArchivedSession.archived_at < older_than)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return purged
+        finally:
+            db.close()
+
+    def reclaim_space(self, vacuum=False):
+        """
+        Checkpoint SQLite's write-ahead log and optionally VACUUM, so space
+        freed by deletes is returned to the filesystem (PostgreSQL: VACUUM
+        ANALYZE only)
+        """
+        dialect = self.engine.dialect.name
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            if dialect == "sqlite":
+                conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+                if vacuum:
+                    conn.execute(text("VACUUM"))
+            elif dialect == "postgresql" and vacuum:
+                conn.execute(text("VACUUM ANALYZE"))
+
+    def add_history(self, session_id, events, recorded_at):
+        """
+        Append detected changes to a session's history
+
+        Args:
+            events: List of dicts with "type" and optional "round", "value",
+                "previous" and "details" keys
+        """
+        if not events:
+            return
+
+        db = self.get_session()
+        try:
+            db.add_all(
+                [
+                    HistoryEvent(
+                        session_id=session_id,
+                        recorded_at=recorded_at,
+                        event_type=event["type"],
+                        round_number=event.get("round"),
+                        value=event.get("value"),
+                        previous=event.get("previous"),
+                        details=(
+                            json.dumps(event["details"])
+                            if event.get("details")
+                            else None
+                        ),
+                    )
+                    for event in events
+                ]
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def get_history(
+        self, session_id, since=None, until=None, event_type=None, limit=None
+    ):
+        """Get a session's history in time order, optionally filtered"""
+        db = self.get_session()
+        try:
+            query = db.query(HistoryEvent).filter(HistoryEvent.session_id == session_id)
+            if since is not None:
+                query = query.filter(HistoryEvent.recorded_at >= since)
+            if until is not None:
+                query = query.filter(HistoryEvent.recorded_at <= until)
+            if event_type is not None:
+                query = query.filter(HistoryEvent.event_type == event_type)
+            query = query.order_by(HistoryEvent.recorded_at, HistoryEvent.id)
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [
+                {
+                    "recorded_at": e.recorded_at,
+                    "type": e.event_type,
+                    "round": e.round_number,
+                    "value": e.value,
+                    "previous": e.previous,
+                    "details": json.loads(e.details) if e.details else None,
+                }
+                for e in query
+            ]
+        finally:
+            db.close()
+
+    def append_journal(self, session_id, kind, data, recorded_at):
+        """
+        Append a published event to a session's journal
+
+        The next seq is picked inside the INSERT itself, so concurrent writers
+        (e.g. processes during a lease handover) can't both take it; where
+        the database still lets two of them collide, the loser retries.
+
+        Returns:
+            int: The event's sequence number (1 for a session's first event)
+        """
+        statement = (
+            insert(JournalEntry)
+            .from_select(
+                ["session_id", "seq", "recorded_at", "kind", "data"],
+                select(
+                    literal(session_id),
+                    func.coalesce(func.max(JournalEntry.seq), 0) + 1,
+                    literal(recorded_at, DateTime),
+                    literal(kind),
+                    literal(json.dumps(data)),
+                ).where(JournalEntry.session_id == session_id),
+            )
+            .returning(JournalEntry.seq)
+        )
+        db = self.get_session()
+        try:
+            for attempt in range(JOURNAL_APPEND_ATTEMPTS):
+                try:
+                    seq = db.execute(statement).scalar_one()
+                    db.commit()
+                    return seq
+                except IntegrityError:
+                    db.rollback()
+                    if attempt == JOURNAL_APPEND_ATTEMPTS - 1:
+                        raise
+        finally:
+            db.close()
+
+    def get_last_journal_seq(self, session_id):
+        """Sequence number of a session's newest journal entry (0 if none)"""
+        db = self.get_session()
+        try:
+            last_seq = (
+                db.query(func.max(JournalEntry.seq))
+                .filter(JournalEntry.session_id == session_id)
+                .scalar()
+            )
+            return last_seq or 0
+        finally:
+            db.close()
+
+    def get_journal(self, session_id, after=0, limit=None):
+        """
+        Get a session's journal entries with a sequence number above ``after``
+
+        When ``after`` falls in the compacted part of the journal, the
+        snapshot that replaced it comes first.
+        """
+        db = self.get_session()
+        try:
+            query = (
+                db.query(JournalEntry)
+                .filter(
+                    JournalEntry.session_id == session_id,
+                    JournalEntry.seq > after,
+                )
+                .order_by(JournalEntry.seq)
+            )
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [
+                {
+                    "seq": e.seq,
+                    "recorded_at": e.recorded_at,
+                    "kind": e.kind,
+                    "data": json.loads(e.data),
+                }
+                for e in query
+            ]
+        finally:
+            db.close()
+
+    def compact_journal(self, session_id, keep):
+        """
+        Fold all but the newest ``keep`` journal entries into one snapshot
+
+        Every update carries the full tournament state, so the snapshot is
+        the last update among the folded entries, kept at its own sequence
+        number. Returns the number of entries removed.
+        """
+        db = self.get_session()
+        try:
+            last_seq = (
+                db.query(func.max(JournalEntry.seq))
+                .filter(JournalEntry.session_id == session_id)
+                .scalar()
+            )
+            if not last_seq or last_seq <= keep:
+                return 0
+            cutoff = last_seq - keep
+
+            snapshot = (
+                db.query(JournalEntry)
+                .filter(
+                    JournalEntry.session_id == session_id,
+                    JournalEntry.seq <= cutoff,
+                    JournalEntry.kind.in_(["update", "snapshot"]),
+                )
+                .order_by(JournalEntry.seq.desc())
+                .first()
+            )
+
+            folded = db.query(JournalEntry).filter(
+                JournalEntry.session_id == session_id, JournalEntry.seq <= cutoff
+            )
+            if snapshot is not None:
+                snapshot.kind = "snapshot"
+                folded = folded.filter(JournalEntry.seq != snapshot.seq)
+
+            removed = folded.delete(synchronize_session=False)
+            db.commit()
+            return removed
+        finally:
+            db.close()
+
+    def heartbeat_owner(self, owner_id):
+        """Record that a monitor process is alive"""
+        db = self.get_session()
+        try:
+            owner = db.query(MonitorOwner).filter(MonitorOwner.id == owner_id).first()
+            if owner:
+                owner.heartbeat_at = utcnow()
+            else:
+                db.add(MonitorOwner(id=owner_id, heartbeat_at=utcnow()))
+            db.commit()
+        finally:
+            db.close()
+
+    def remove_owner(self, owner_id):
+        """Remove a monitor process and release all of its leases"""
+        db = self.get_session()
+        try:
+            db.query(Session).filter(Session.owner_id == owner_id).update(
+                {Session.owner_id: None, Session.lease_expires_at: None},
+                synchronize_session=False,
+            )
+            db.query(MonitorOwner).filter(MonitorOwner.id == owner_id).delete(
+                synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def count_live_owners(self, lease_seconds):
+        """Count monitor processes that sent a heartbeat within the lease period"""
+        db = self.get_session()
+        try:
+            cutoff = utcnow() - timedelta(seconds=lease_seconds)
+            return (
+                db.query(func.count(MonitorOwner.id))
+                .filter(MonitorOwner.heartbeat_at >= cutoff)
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    def count_active_players(self):
+        """Count players that still need a monitor (the unit of leasing)"""
+        db = self.get_session()
+        try:
+            return (
+                db.query(func.count(func.distinct(Session.player_key)))
+                .filter(Session.status.notin_(["finished", "error"]))
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    def count_active_sessions(self):
+        """Count sessions that still need a monitor"""
+        db = self.get_session()
+        try:
+            return (
+                db.query(func.count(Session.id))
+                .filter(Session.status.notin_(["finished", "error"]))
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    def claim_sessions(
+        self, owner_id, lease_seconds, limit, session_ids=None, player_keys=None
+    ):
+        """
+        Atomically claim up to ``limit`` players' unowned or expired sessions
+
+        A player's sessions are claimed together, and only while no other
+        process holds a live lease on any of them, so one player is never
+        polled by two processes. Each claim is a conditional UPDATE, so when
+        several processes race for the same player exactly one of them wins.
+
+        Args:
+            limit: Most players to claim (None for no limit)
+            session_ids: Only claim the players of these sessions
+            player_keys: Only claim these players (e.g. to pick up new
+                sessions of players this owner already holds)
+
+        Returns:
+            list: Session dicts that are now leased to ``owner_id``
+        """
+        db = self.get_session()
+        try:
+            now = utcnow()
+            active = Session.status.notin_(["finished", "error"])
+            claimable = or_(Session.owner_id.is_(None), Session.lease_expires_at < now)
+            other = aliased(Session)
+            held_elsewhere = exists().where(
+                other.player_key == Session.player_key,
+                other.owner_id != owner_id,
+                other.lease_expires_at >= now,
+                other.status.notin_(["finished", "error"]),
+            )
+
+            query = db.query(Session.player_key).filter(
+                active, claimable, ~held_elsewhere
+            )
+            if session_ids is not None:
+                keys = select(Session.player_key).where(Session.id.in_(session_ids))
+                query = query.filter(Session.player_key.in_(keys))
+            if player_keys is not None:
+                query = query.filter(Session.player_key.in_(player_keys))
+            candidates = [
+                row.player_key
+                for row in query.group_by(Session.player_key)
+                .order_by(func.min(Session.created_at))
+                .limit(limit)
+            ]
+
+            claimed = []
+            for key in candidates:
+                rows = db.execute(
+                    update(Session)
+                    .where(
+                        Session.player_key == key, active, claimable, ~held_elsewhere
+                    )
+                    .values(
+                        owner_id=owner_id,
+                        lease_expires_at=now + timedelta(seconds=lease_seconds),
+                        heartbeat_at=now,
+                    )
+                    .returning(Session.id)
+                )
+                claimed += [row.id for row in rows]
+                db.commit()
+        finally:
+            db.close()
+
+        sessions = [self.get_session_by_id(session_id) for session_id in claimed]
+        return [session for session in sessions if session]
+
+    def renew_leases(self, owner_id, session_ids, lease_seconds):
+        """
+        Extend the leases this owner still holds
+
+        Returns:
+            set: IDs of the sessions still leased to ``owner_id``
+        """
+        if not session_ids:
+            return set()
+
+        db = self.get_session()
+        try:
+            now = utcnow()
+            db.query(Session).filter(
+                Session.owner_id == owner_id, Session.id.in_(session_ids)
+            ).update(
+                {
+                    Session.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                    Session.heartbeat_at: now,
+                },
+                synchronize_session=False,
+            )
+            db.commit()
+            rows = db.query(Session.id).filter(
+                Session.owner_id == owner_id, Session.id.in_(session_ids)
+            )
+            return {row.id for row in rows}
+        finally:
+            db.close()
+
+    def release_lease(self, session_id, owner_id):
+        """Give up a session's lease so another process can claim it"""
+        db = self.get_session()
+        try:
+            db.query(Session).filter(
+                Session.id == session_id, Session.owner_id == owner_id
+            ).update(
+                {Session.owner_id: None, Session.lease_expires_at: None},
+                synchronize_session=False,
+            )
+            db.commit()
+        finally:
+            db.close()
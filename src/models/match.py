@@ -17,6 +17,10 @@ class Match:
     result: str  # "1", "0", "0.5", or empty for TBD
     pairing: str  # e.g., "33-79" (white-black)
     color: Optional[str] = None  # "White", "Black", or None
+    opponent_rating: Optional[str] = None  # from the round table or opponent profile
+    opponent_federation: Optional[str] = None
+    opponent_title: Optional[str] = None
+    rating_change: Optional[float] = None  # Elo delta for this game once played
 
     def is_completed(self) -> bool:
         """Check if the match has a result"""
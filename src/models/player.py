@@ -14,7 +14,12 @@ class Player:
     snr: str  # Player serial number
     starting_rank: Optional[str] = None
     current_rank: Optional[str] = None
+    points: Optional[str] = None
     federation: Optional[str] = None
+    tiebreaks: Optional[dict] = None  # computed locally, see services/crosstable.py
+    rating: Optional[str] = None
+    k_factor: Optional[str] = None  # from the player page, else from rating
+    rating_change: Optional[float] = None  # sum over rated games so far
 
     def __str__(self) -> str:
         return f"{self.name} (SNR: {self.snr})"
@@ -0,0 +1,171 @@
+"""
+Optional process pool for HTML parsing
+
+BeautifulSoup parsing is CPU-bound pure Python, so with many sessions it
+saturates the one core the GIL allows. The parse executor ships raw HTML
+bytes to worker processes and gets compact dicts back, which are rebuilt
+into model objects in the calling thread.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup
+from .tournament_parser import TournamentParser
+from ..models.player import Player
+from ..models.match import Match
+from ..models.tournament import Tournament
+
+
+def _parse_player_page(
+    html: bytes, tournament_id: str, player_snr: str
+) -> Optional[dict]:
+    """Parse a player page into a plain dict (runs in a worker process)"""
+    soup = BeautifulSoup(html, "html.parser")
+    try:
+        tournament = TournamentParser.parse_tournament_state(
+            soup, tournament_id, player_snr
+        )
+        return asdict(tournament) if tournament else None
+    finally:
+        # Break the tree's reference cycles so it is freed right away
+        soup.decompose()
+
+
+def _parse_round_page(
+    html: bytes, player_snr: str, opponent_snr: str
+) -> Tuple[Optional[str], str]:
+    """Parse the player's color from a round page (runs in a worker process)"""
+    soup = BeautifulSoup(html, "html.parser")
+    try:
+        return TournamentParser.parse_color_from_round_page(
+            soup, player_snr, opponent_snr
+        )
+    finally:
+        soup.decompose()
+
+
+def _parse_round_pairings(html: bytes) -> List[Dict[str, Optional[str]]]:
+    """Parse every board of a round page (runs in a worker process)"""
+    soup = BeautifulSoup(html, "html.parser")
+    try:
+        return TournamentParser.parse_round_pairings(soup)
+    finally:
+        soup.decompose()
+
+
+def _parse_profile_page(html: bytes) -> Dict[str, Optional[str]]:
+    """Parse another player's profile (runs in a worker process)"""
+    soup = BeautifulSoup(html, "html.parser")
+    try:
+        return TournamentParser.parse_player_profile(soup)
+    finally:
+        soup.decompose()
+
+
+def _parse_standings_page(html: bytes) -> Dict[str, Dict[str, str]]:
+    """Parse a standings page (runs in a worker process)"""
+    soup = BeautifulSoup(html, "html.parser")
+    try:
+        return TournamentParser.parse_standings(soup)
+    finally:
+        soup.decompose()
+
+
+def _warm_up() -> bool:
+    """No-op task used to start the worker processes"""
+    return True
+
+
+def tournament_from_dict(data: dict) -> Tournament:
+    """Rebuild a Tournament from the dict produced by a worker"""
+    return Tournament(
+        tournament_id=data["tournament_id"],
+        player=Player(**data["player"]),
+        matches=[Match(**match) for match in data["matches"]],
+        total_rounds=data["total_rounds"],
+    )
+
+
+class ParseExecutor:
+    """
+    Parses chess-results.com pages inline or on a bounded process pool
+
+    With ``max_workers`` of 0 parsing happens in the calling thread. Otherwise
+    at most ``max_pending`` pages are queued for the pool at once; callers
+    beyond that block until a slot frees up.
+    """
+
+    def __init__(self, max_workers: int = 0, max_pending: int = 64):
+        self.max_workers = max_workers
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+
+        if max_workers > 0:
+            # Fork the workers now, before monitor threads exist, so no lock
+            # can be held mid-fork
+            self.pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+            self.pool.submit(_warm_up).result()
+            print(f"🧮 Parse pool started with {max_workers} processes")
+
+    def _run(self, fn, *args):
+        """Run a parse function inline or on the pool"""
+        if self.pool is None:
+            return fn(*args)
+
+        with self._slots:
+            return self.pool.submit(fn, *args).result()
+
+    def parse_tournament_state(
+        self, html: bytes, tournament_id: str, player_snr: str
+    ) -> Optional[Tournament]:
+        """Parse complete tournament state from a player page"""
+        data = self._run(_parse_player_page, html, tournament_id, player_snr)
+        return tournament_from_dict(data) if data else None
+
+    def parse_color_from_round_page(
+        self, html: bytes, player_snr: str, opponent_snr: str
+    ) -> Tuple[Optional[str], str]:
+        """Parse round pairing page to determine player color"""
+        return self._run(_parse_round_page, html, player_snr, opponent_snr)
+
+    def parse_standings(self, html: bytes) -> Dict[str, Dict[str, str]]:
+        """Parse the standings page"""
+        return self._run(_parse_standings_page, html)
+
+    def parse_round_pairings(self, html: bytes) -> List[Dict[str, Optional[str]]]:
+        """Parse every board of a round pairing page"""
+        return self._run(_parse_round_pairings, html)
+
+    def parse_player_profile(self, html: bytes) -> Dict[str, Optional[str]]:
+        """Parse rating, federation and title from a player page"""
+        return self._run(_parse_profile_page, html)
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+
+_executor = ParseExecutor()
+_executor_lock = threading.Lock()
+
+
+def configure_parse_executor(max_workers: int, max_pending: int) -> ParseExecutor:
+    """Replace the process-wide parse executor (call before starting monitors)"""
+    global _executor
+    with _executor_lock:
+        _executor.shutdown()
+        _executor = ParseExecutor(max_workers, max_pending)
+        return _executor
+
+
+def get_parse_executor() -> ParseExecutor:
+    """Get the process-wide parse executor"""
+    return _executor
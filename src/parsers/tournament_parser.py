@@ -3,7 +3,7 @@ Tournament HTML parser for chess-results.com
 """
 
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from ..models.player import Player
 from ..models.match import Match
@@ -23,6 +23,8 @@ class TournamentParser:
         name = "Unknown Player"
         starting_rank = None
         current_rank = None
+        points = None
+        k_factor = None
 
         # First table contains player info
         table = tables[0]
@@ -40,14 +42,56 @@ class TournamentParser:
                     starting_rank = value
                 elif label == "rank":
                     current_rank = value
+                elif label == "points":
+                    points = value
+                elif label in ("k", "k-factor"):
+                    k_factor = value
+
+        profile = TournamentParser.parse_player_profile(soup)
 
         return Player(
             name=name,
             snr="",  # SNR comes from config
             starting_rank=starting_rank,
             current_rank=current_rank,
+            points=points,
+            federation=profile["federation"],
+            rating=profile["rating"],
+            k_factor=k_factor,
         )
 
+    @staticmethod
+    def parse_player_profile(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+        """
+        Extract rating, federation and title from a player's details table
+        Returns: {"rating": ..., "federation": ..., "title": ...}
+        """
+        profile = {"rating": None, "federation": None, "title": None}
+
+        tables = soup.find_all("table", class_="CRs1")
+        if not tables:
+            return profile
+
+        for row in tables[0].find_all("tr"):
+            cols = row.find_all("td")
+            if len(cols) >= 2:
+                label = cols[0].get_text(strip=True).lower()
+                value = cols[1].get_text(strip=True) or None
+
+                # Prefer the international rating, fall back to any other
+                if label in ("rating international", "rating"):
+                    if value and value != "0":
+                        profile["rating"] = value
+                elif label == "rating national" and not profile["rating"]:
+                    if value and value != "0":
+                        profile["rating"] = value
+                elif label in ("federation", "fed"):
+                    profile["federation"] = value
+                elif label == "title":
+                    profile["title"] = value
+
+        return profile
+
     @staticmethod
     def parse_total_rounds(soup: BeautifulSoup) -> int:
         """Extract total number of rounds from the page"""
@@ -101,6 +145,16 @@ class TournamentParser:
         header_row = rows[0]
         headers = header_row.find_all("th")
         result_col_index = TournamentParser.find_result_column_index(headers)
+        header_texts = [h.get_text(strip=True).lower() for h in headers]
+        rating_col_index = header_texts.index("rtg") if "rtg" in header_texts else None
+        fed_col_index = header_texts.index("fed") if "fed" in header_texts else None
+        # The unlabelled column between SNo and Name holds the title (FM, IM, ...)
+        title_col_index = 3 if len(header_texts) > 4 and not header_texts[3] else None
+
+        def cell(cols, index) -> Optional[str]:
+            if index is None or index >= len(cols):
+                return None
+            return cols[index].get_text(strip=True) or None
 
         matches = []
         for row in rows[1:]:  # Skip header
@@ -116,6 +170,8 @@ class TournamentParser:
                     else ""
                 )
 
+                opponent_rating = cell(cols, rating_col_index) or ""
+
                 match = Match(
                     round_number=round_num,
                     board_number=board_num,
@@ -124,6 +180,14 @@ class TournamentParser:
                     result=result,
                     pairing="",  # Will be filled by color detection
                     color=None,
+                    # Missing fields are filled from the opponent's profile
+                    opponent_rating=(
+                        opponent_rating
+                        if opponent_rating.isdigit() and opponent_rating != "0"
+                        else None
+                    ),
+                    opponent_federation=cell(cols, fed_col_index),
+                    opponent_title=cell(cols, title_col_index),
                 )
                 matches.append(match)
 
@@ -164,6 +228,143 @@ class TournamentParser:
 
         return None, f"{player_snr}-{opponent_snr}"
 
+    @staticmethod
+    def parse_round_pairings(soup: BeautifulSoup) -> List[Dict[str, Optional[str]]]:
+        """
+        Parse every board of a round pairing page
+        Returns: [{"white", "black", "result", "white_rating", "black_rating",
+                   "white_name", "black_name"}]; "black" is None for a bye
+        """
+        tables = soup.find_all("table", class_="CRs1")
+        if not tables:
+            return []
+
+        rows = tables[0].find_all("tr")
+        if not rows:
+            return []
+
+        # Columns come in pairs (white ... black); locate them by header
+        headers = [
+            cell.get_text(strip=True).lower() for cell in rows[0].find_all(["th", "td"])
+        ]
+        number_cols = [i for i, h in enumerate(headers) if h == "no."]
+        rating_cols = [i for i, h in enumerate(headers) if h.startswith("rtg")]
+        name_cols = [i for i, h in enumerate(headers) if h == "name"]
+        result_col = headers.index("result") if "result" in headers else None
+
+        def cell(cols, index):
+            if index is None or index >= len(cols):
+                return None
+            return cols[index].get_text(strip=True) or None
+
+        pairings = []
+        for row in rows[1:]:
+            cols = row.find_all("td")
+            if len(cols) < 2:
+                continue
+
+            if len(number_cols) >= 2:
+                white = cell(cols, number_cols[0])
+                black = cell(cols, number_cols[-1])
+            else:
+                # Same layout assumption as parse_color_from_round_page
+                white = cell(cols, 1)
+                black = None
+                for i in range(len(cols) - 1, max(10, len(cols) - 5), -1):
+                    text = cols[i].get_text(strip=True)
+                    if text.isdigit() and text != white:
+                        black = text
+                        break
+
+            if not white or not white.isdigit():
+                continue
+
+            pairings.append(
+                {
+                    "white": white,
+                    "black": black if black and black.isdigit() else None,
+                    "result": cell(cols, result_col),
+                    "white_rating": cell(cols, rating_cols[0]) if rating_cols else None,
+                    "black_rating": (
+                        cell(cols, rating_cols[-1]) if len(rating_cols) >= 2 else None
+                    ),
+                    "white_name": cell(cols, name_cols[0]) if name_cols else None,
+                    "black_name": (
+                        cell(cols, name_cols[-1]) if len(name_cols) >= 2 else None
+                    ),
+                }
+            )
+
+        return pairings
+
+    @staticmethod
+    def color_from_pairings(
+        pairings: List[Dict[str, Optional[str]]], player_snr: str, opponent_snr: str
+    ) -> Tuple[Optional[str], str]:
+        """
+        Find the player's color in a round parsed by parse_round_pairings
+        Returns: (color, pairing_string)
+        """
+        for board in pairings:
+            if board["white"] == player_snr:
+                return "White", f"{player_snr}-{opponent_snr}"
+            if board["black"] == player_snr:
+                return "Black", f"{opponent_snr}-{player_snr}"
+
+        return None, f"{player_snr}-{opponent_snr}"
+
+    @staticmethod
+    def parse_standings(soup: BeautifulSoup) -> Dict[str, Dict[str, str]]:
+        """
+        Parse the standings (ranking list) page
+        Returns: {snr: {"rank": ..., "points": ..., "name": ...}}
+        """
+        standings = {}
+
+        for table in soup.find_all("table", class_="CRs1"):
+            rows = table.find_all("tr")
+            if not rows:
+                continue
+
+            # Header cells may be <th> or <td> depending on the page
+            headers = [
+                cell.get_text(strip=True).lower()
+                for cell in rows[0].find_all(["th", "td"])
+            ]
+            if "rk." not in headers or "sno" not in headers:
+                continue
+
+            rank_col = headers.index("rk.")
+            snr_col = headers.index("sno")
+            name_col = headers.index("name") if "name" in headers else None
+            points_col = headers.index("pts.") if "pts." in headers else None
+
+            for row in rows[1:]:
+                cols = row.find_all("td")
+                if len(cols) <= max(rank_col, snr_col):
+                    continue
+
+                snr = cols[snr_col].get_text(strip=True)
+                if not snr.isdigit():
+                    continue
+
+                standings[snr] = {
+                    "rank": cols[rank_col].get_text(strip=True),
+                    "points": (
+                        cols[points_col].get_text(strip=True)
+                        if points_col is not None and len(cols) > points_col
+                        else None
+                    ),
+                    "name": (
+                        cols[name_col].get_text(strip=True)
+                        if name_col is not None and len(cols) > name_col
+                        else None
+                    ),
+                }
+            break
+
+        return standings
+
     @staticmethod
     def parse_tournament_state(
         soup: BeautifulSoup, tournament_id: str, player_snr: str
@@ -60,3 +60,18 @@ def parse_chess_url(url):
     except Exception as e:
         print(f"Error parsing URL: {e}")
         return None
+
+
+def player_key(parsed):
+    """
+    Normalized identity of the player a URL or session config points at
+
+    Returns:
+        tuple: (server, tournament_id, player_snr, federation)
+    """
+    return (
+        parsed["server"],
+        parsed["tournament_id"],
+        parsed["player_snr"],
+        parsed["federation"],
+    )
@@ -0,0 +1,78 @@
+"""
+Cooperative cancellation for monitors and the work they start
+"""
+
+import threading
+from typing import Callable, List
+
+
+class Cancelled(BaseException):
+    """
+    Raised at a checkpoint once the token is cancelled
+
+    Derives from BaseException, like asyncio.CancelledError, so the broad
+    ``except Exception`` handlers around polling don't swallow it or count
+    it as a failed request.
+    """
+
+
+class CancellationToken:
+    """
+    Stop signal for one monitor, checked between stages of every poll
+
+    Sleeps taken through the token return as soon as it is cancelled, and
+    callbacks registered with ``on_cancel`` run once at that moment (e.g. to
+    close HTTP connections or wake other waits).
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called"""
+        return self._event.is_set()
+
+    def cancel(self):
+        """Cancel the token and run its callbacks (only the first call counts)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️  Cancellation callback failed: {e}")
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run ``callback`` when the token is cancelled (right away if it is)
+
+        Returns:
+            A function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+        callback()
+        return lambda: None
+
+    def _unregister(self, callback: Callable[[], None]):
+        """Forget a callback that is no longer needed"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self):
+        """Checkpoint: raise Cancelled once the token is cancelled"""
+        if self._event.is_set():
+            raise Cancelled()
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep up to ``seconds``; returns True if woken by cancellation"""
+        return self._event.wait(max(0.0, seconds))
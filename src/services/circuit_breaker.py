@@ -0,0 +1,108 @@
+"""
+Per-host circuit breaker shared by all monitoring sessions
+"""
+
+import threading
+import time
+from typing import Dict
+
+
+class CircuitBreaker:
+    """
+    Tracks upstream failures for a single chess-results server host
+
+    closed:    requests flow normally, failures are counted
+    open:      requests are skipped until ``reset_timeout`` has elapsed
+    half_open: exactly one probe request is let through; its outcome
+               closes the breaker again or re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: int = 60):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._probe_thread = None  # thread holding the half-open probe
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Return True if the caller may contact the host right now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at >= self.reset_timeout:
+                    # This caller becomes the single probe
+                    self.state = self.HALF_OPEN
+                    self._probe_thread = threading.get_ident()
+                    print(f"🔌 Circuit half-open for {self.host}, sending probe")
+                    return True
+                return False
+
+            # Half-open: a probe is already in flight
+            return False
+
+    def record_success(self):
+        """Record a successful request"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                print(f"✅ Circuit closed for {self.host}")
+            self.state = self.CLOSED
+            self.failure_count = 0
+
+    def record_failure(self):
+        """Record a failed request"""
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED
+                and self.failure_count >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                print(
+                    f"🚫 Circuit open for {self.host} after {self.failure_count} failures"
+                )
+
+    def release_probe(self):
+        """
+        Give back the half-open probe without an outcome (e.g. the caller was
+        cancelled mid-request); the next caller probes instead
+
+        Does nothing unless the calling thread holds the probe.
+        """
+        with self._lock:
+            if (
+                self.state == self.HALF_OPEN
+                and self._probe_thread == threading.get_ident()
+            ):
+                # Keep the old opened_at, so the reset timeout has still elapsed
+                self.state = self.OPEN
+
+    def is_open(self) -> bool:
+        """Check if requests to the host are currently being skipped"""
+        with self._lock:
+            return self.state != self.CLOSED
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(
+    host: str, failure_threshold: int = 5, reset_timeout: int = 60
+) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a host, creating it if needed"""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, failure_threshold, reset_timeout)
+            _breakers[host] = breaker
+        return breaker
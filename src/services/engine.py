@@ -0,0 +1,386 @@
+"""
+Monitoring engine: runs monitor threads for the sessions this process leases
+"""
+
+import threading
+import traceback
+from dataclasses import fields
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from ..config import Config
+from ..database import Database
+from ..api.client import ChessResultsClient
+from ..models.tournament import Tournament
+from ..models.player import Player
+from ..models.match import Match
+from ..parsers.url_parser import player_key
+from ..parsers.parse_pool import configure_parse_executor, get_parse_executor
+from .monitor import TournamentMonitor, diff_states
+from .update_processor import UpdateProcessor, UpdateEvent
+from .lease_manager import LeaseManager
+from .freshness import stamp
+from .rating_change import rating_changes
+from .standings import standings_fetcher
+from .crosstable import crosstables
+from .cancellation import CancellationToken
+from .frozen import frozen_archive
+
+
+def prune_tournament_caches(live_tournaments: Set[Tuple[str, str]]):
+    """Drop the tournament-wide caches of tournaments no live session watches"""
+    standings_fetcher.prune(live_tournaments)
+    crosstables.prune(live_tournaments)
+    rating_changes.prune(live_tournaments)
+
+
+def serialize_tournament(tournament: Tournament) -> dict:
+    """Convert Tournament object to JSON-serializable dict"""
+    return {
+        "tournament_id": tournament.tournament_id,
+        "player": {
+            "name": tournament.player.name,
+            "snr": tournament.player.snr,
+            "starting_rank": tournament.player.starting_rank,
+            "current_rank": tournament.player.current_rank,
+            "points": tournament.player.points,
+            "tiebreaks": tournament.player.tiebreaks,
+            "rating": tournament.player.rating,
+            "k_factor": tournament.player.k_factor,
+            "rating_change": tournament.player.rating_change,
+        },
+        "matches": [
+            {
+                "round_number": m.round_number,
+                "board_number": m.board_number,
+                "opponent_snr": m.opponent_snr,
+                "opponent_name": m.opponent_name,
+                "result": m.result,
+                "pairing": m.pairing,
+                "color": m.color,
+                "opponent_rating": m.opponent_rating,
+                "opponent_federation": m.opponent_federation,
+                "opponent_title": m.opponent_title,
+                "rating_change": m.rating_change,
+                "is_completed": m.is_completed(),
+            }
+            for m in tournament.matches
+        ],
+        "total_rounds": tournament.total_rounds,
+        "completed_rounds": tournament.get_completed_rounds(),
+        "is_finished": tournament.is_finished(),
+    }
+
+
+def deserialize_tournament(data: Optional[dict]) -> Optional[Tournament]:
+    """Rebuild a Tournament from a stored serialize_tournament() dict"""
+    if not data or "player" not in data:
+        return None
+    player_fields = {f.name for f in fields(Player)}
+    match_fields = {f.name for f in fields(Match)}
+    return Tournament(
+        tournament_id=data["tournament_id"],
+        player=Player(
+            **{k: v for k, v in data["player"].items() if k in player_fields}
+        ),
+        matches=[
+            Match(**{k: v for k, v in match.items() if k in match_fields})
+            for match in data["matches"]
+        ],
+        total_rounds=data["total_rounds"],
+    )
+
+
+class SharedMonitor:
+    """One polling thread for a player, feeding every session that watches them"""
+
+    def __init__(self, key: Tuple[str, str, str, str], config: Config):
+        self.key = key
+        self.config = config
+        self.sessions: Set[str] = set()
+        # Cancelled when the last session detaches; interrupts polling at once
+        self.token = CancellationToken()
+        # Last state handed to subscribers, replayed to sessions that attach later
+        self.latest: Optional[Tournament] = None
+
+
+class MonitorEngine:
+    """
+    Polls and parses every session leased to this process
+
+    Updates are written to the database by the update workers and then handed
+    to ``publish(session_id, data)``, which delivers them to SSE clients:
+    directly into in-memory queues when the engine runs inside the web
+    process, or over IPC when it runs in the standalone monitor daemon.
+    """
+
+    def __init__(self, db: Database, publish: Callable[[str, dict], None]):
+        self.db = db
+        self.publish = publish
+        self.config = Config.from_env()
+        # Sessions watching the same player share one monitor
+        self.monitors: Dict[Tuple[str, str, str, str], SharedMonitor] = {}
+        self.session_keys: Dict[str, Tuple[str, str, str, str]] = {}
+        self._monitors_lock = threading.Lock()
+
+        # Start parse processes before any monitor thread exists
+        configure_parse_executor(
+            self.config.parse_workers, self.config.parse_queue_size
+        )
+
+        # Side effects run on their own worker pool so slow DB writes never delay polling
+        self.update_processor = UpdateProcessor(
+            self.process_update,
+            num_workers=self.config.update_workers,
+            queue_size=self.config.update_queue_size,
+        )
+
+        # Sessions are leased so each one is monitored by exactly one process, and
+        # taken over automatically when that process dies
+        self.lease_manager = LeaseManager(
+            db,
+            on_claim=self._on_session_claimed,
+            on_release=self.stop_session,
+            lease_seconds=self.config.lease_seconds,
+        )
+
+    def start(self):
+        """Start the update workers and begin leasing sessions"""
+        self.update_processor.start()
+        self.lease_manager.start()
+
+    def stop(self):
+        """Hand all sessions back and stop the update workers"""
+        self.lease_manager.stop()
+        self.update_processor.stop()
+        get_parse_executor().shutdown()
+
+    def claim_and_start(self, sessions: List[tuple]):
+        """
+        Lease newly created sessions to this process and start monitoring them
+
+        Args:
+            sessions: List of (session_id, config) tuples. First polls are
+                spread evenly across the check interval.
+        """
+        claimed = self.lease_manager.claim([session_id for session_id, _ in sessions])
+        for i, (session_id, config) in enumerate(sessions):
+            if session_id in claimed:
+                initial_delay = config.check_interval * i / len(sessions)
+                self.start_session(session_id, config, initial_delay)
+
+    def start_session(self, session_id: str, config: Config, initial_delay: float = 0):
+        """Attach a session to its player's monitor, starting one if needed"""
+        key = player_key(config.to_session_dict())
+        with self._monitors_lock:
+            if session_id in self.session_keys:
+                return
+
+            shared = self.monitors.get(key)
+            if shared is not None and not shared.token.cancelled:
+                shared.sessions.add(session_id)
+                self.session_keys[session_id] = key
+                latest = shared.latest
+                print(
+                    f"🔗 Session {session_id} attached to existing monitor "
+                    f"({len(shared.sessions)} sessions)"
+                )
+            else:
+                shared = SharedMonitor(key, config)
+                shared.sessions.add(session_id)
+                self.monitors[key] = shared
+                self.session_keys[session_id] = key
+                latest = None
+                threading.Thread(
+                    target=self.monitor_worker,
+                    args=(shared, initial_delay),
+                    daemon=True,
+                ).start()
+                return
+
+        # A late subscriber starts from the state the others already have,
+        # diffed against what it stored itself before (e.g. on another process)
+        self.db.update_session(session_id, status="running")
+        if latest is not None:
+            session = self.db.get_session_by_id(session_id)
+            stored = deserialize_tournament(session["data"] if session else None)
+            self.update_processor.submit(
+                UpdateEvent(
+                    session_id=session_id,
+                    tournament=latest,
+                    changes=diff_states(stored, latest),
+                )
+            )
+
+    def stop_session(self, session_id: str):
+        """Detach a session; its monitor stops when the last session detaches"""
+        with self._monitors_lock:
+            key = self.session_keys.pop(session_id, None)
+            shared = self.monitors.get(key)
+            if shared is None:
+                return
+
+            shared.sessions.discard(session_id)
+            if not shared.sessions:
+                shared.token.cancel()
+                del self.monitors[key]
+
+        self.lease_manager.release(session_id)
+
+    def _on_session_claimed(self, session: dict, initial_delay: float):
+        """Start monitoring a session this process has just leased"""
+        config = Config.from_session(session["config"])
+        self.start_session(session["id"], config, initial_delay)
+        print(f"✅ Started monitoring for leased session: {session['id']}")
+
+    def process_update(self, event: UpdateEvent):
+        """Apply the side effects of a monitor update (runs on the update workers)"""
+        session_id = event.session_id
+
+        session = self.db.get_session_by_id(session_id)
+        if not session:
+            # Stopped through another process: detach now instead of polling
+            # on until the lease renewal notices
+            self.stop_session(session_id)
+            return
+
+        # Handle status change
+        if event.status:
+            self.db.update_session(session_id, status=event.status)
+            if event.status == "finished":
+                # Final state from now on; serve it without the live pipeline
+                frozen_archive.freeze(self.db.get_session_by_id(session_id))
+            return
+
+        # Handle error case
+        if event.error:
+            print(f"⚠️  Monitor error [{session_id}]: {event.error}")
+            error_data = {
+                "error": event.error,
+                "timestamp": event.detected_at.isoformat(),
+                "type": "fetch_error",
+            }
+            self.db.update_session(
+                session_id, last_update=datetime.now(), error=event.error
+            )
+            self._journal(session_id, "error", error_data, event.detected_at)
+            self.publish(session_id, error_data)
+            return
+
+        # Handle normal update
+        tournament = event.tournament
+        if tournament:
+            print(
+                f"✅ Update [{session_id}] - Rounds: {tournament.get_completed_rounds()}/{tournament.total_rounds}"
+            )
+            data = serialize_tournament(tournament)
+            data["new_round"] = event.new_round is not None
+            data["timestamp"] = event.detected_at.isoformat()
+
+            # Update session in database and append to its history
+            self.db.update_session(session_id, data=data, last_update=datetime.now())
+            self.db.add_history(session_id, event.changes, event.detected_at)
+            self._journal(session_id, "update", data, event.detected_at)
+            stamp(event.trace, "db_commit")
+
+            if event.trace:
+                data["trace"] = event.trace
+            stamp(event.trace, "enqueued")
+            self.publish(session_id, data)
+
+    def _journal(self, session_id: str, kind: str, data: dict, recorded_at: datetime):
+        """Persist an event before publishing it and tag it with its sequence number"""
+        seq = self.db.append_journal(session_id, kind, data, recorded_at)
+        data["seq"] = seq
+
+        # Keep the journal bounded: a snapshot plus at most two batches of events
+        if seq % self.config.journal_keep == 0:
+            self.db.compact_journal(session_id, self.config.journal_keep)
+
+    def _stored_state(self, session_ids: List[str]) -> Optional[Tournament]:
+        """Latest state stored for a player by any of its sessions"""
+        for session_id in session_ids:
+            session = self.db.get_session_by_id(session_id)
+            stored = deserialize_tournament(session["data"] if session else None)
+            if stored is not None:
+                return stored
+        return None
+
+    def monitor_worker(self, shared: SharedMonitor, initial_delay: float = 0):
+        """Background worker polling one player for all of its sessions"""
+        config = shared.config
+        label = f"{config.tournament_id}/{config.player_snr}"
+        print(f"🔧 Monitor worker starting for player: {label}")
+        print(f"⚙️  Check interval: {config.check_interval}s")
+
+        def subscribers() -> List[str]:
+            with self._monitors_lock:
+                return list(shared.sessions)
+
+        try:
+            with ChessResultsClient(config, shared.token) as client:
+                monitor = TournamentMonitor(config, client, shared.token)
+                monitor.stored_state = self._stored_state(subscribers())
+
+                def on_update(tournament, new_round, error=None, trace=None):
+                    """Callback when tournament updates - fans out to the update workers"""
+                    # Only a poll's own publish is traced; a color filled in
+                    # later would be measured against that poll's fetch
+                    trace = dict(trace) if trace else None
+                    stamp(trace, "detected")
+                    changes = monitor.detect_changes(tournament) if tournament else []
+                    if tournament:
+                        shared.latest = tournament
+
+                    for session_id in subscribers():
+                        self.update_processor.submit(
+                            UpdateEvent(
+                                session_id=session_id,
+                                tournament=tournament,
+                                new_round=new_round,
+                                error=error,
+                                changes=changes,
+                                trace=dict(trace) if trace else None,
+                            )
+                        )
+
+                # Update session status
+                for session_id in subscribers():
+                    self.db.update_session(session_id, status="running")
+                print(f"▶️  Monitor started for player: {label}")
+
+                # Run monitor until finished or its last session detaches
+                monitor.run(callback=on_update, initial_delay=initial_delay)
+
+                if shared.token.cancelled:
+                    print(f"⏹️  Monitor stopped for player: {label}")
+                    return
+
+                # Mark as finished once the queued updates have been applied
+                for session_id in subscribers():
+                    self.update_processor.submit(
+                        UpdateEvent(session_id=session_id, status="finished")
+                    )
+                print(f"🏁 Monitor finished for player: {label}")
+
+        except Exception as e:
+            print(f"❌ Monitor error [{label}]: {e}")
+            traceback.print_exc()
+            for session_id in subscribers():
+                self.db.update_session(session_id, status="error", error=str(e))
+                self.publish(session_id, {"error": str(e), "type": "worker_error"})
+
+        finally:
+            # Only clean up if a newer monitor hasn't taken over the player
+            with self._monitors_lock:
+                if self.monitors.get(shared.key) is shared:
+                    del self.monitors[shared.key]
+                    released = list(shared.sessions)
+                    for session_id in released:
+                        self.session_keys.pop(session_id, None)
+                else:
+                    released = []
+            for session_id in released:
+                self.lease_manager.release(session_id)
+            rating_changes.forget(
+                config.server, config.tournament_id, config.player_snr
+            )
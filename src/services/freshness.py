@@ -0,0 +1,148 @@
+"""
+End-to-end freshness tracing from upstream fetch to browser delivery
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+from ..config import Config
+
+# Pipeline stages in order; each is timed from the start of the fetch that
+# saw the change
+STAGES = [
+    "fetch_end",
+    "parse_end",
+    "enriched",
+    "detected",
+    "db_commit",
+    "enqueued",
+    "sse_write",
+]
+
+# Time the change could have been sitting upstream before that fetch
+POLL_GAP = "poll_gap"
+
+PERCENTILES = (50, 90, 99)
+
+
+def stamp(trace: Optional[Dict[str, float]], stage: str):
+    """Record the current wall-clock time for a stage (no-op without a trace)"""
+    if trace is not None:
+        trace[stage] = time.time()
+
+
+def _percentile(sorted_values: list, pct: int) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, -(-len(sorted_values) * pct // 100) - 1)
+    return sorted_values[index]
+
+
+class FreshnessTracker:
+    """
+    Rolling windows of stage latencies, per session and across all sessions
+
+    Traces are plain dicts of stage -> epoch seconds so they survive the IPC
+    hop from the monitor daemon; wall-clock time is used for the same reason.
+    """
+
+    def __init__(
+        self,
+        window: int = 500,
+        global_window: int = 5000,
+        alert_seconds: float = 0,
+    ):
+        self.window = window
+        self.alert_seconds = alert_seconds
+        self.alerts = 0
+        self._global: Dict[str, Deque[float]] = {
+            stage: deque(maxlen=global_window) for stage in STAGES + [POLL_GAP]
+        }
+        self._sessions: Dict[str, Dict[str, Deque[float]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, session_id: str, trace: Dict[str, float], stages=None):
+        """Add the latencies of a trace (optionally only some ``stages``)"""
+        start = trace.get("fetch_start")
+        if start is None:
+            return
+
+        latencies = {
+            stage: trace[stage] - start
+            for stage in (stages or STAGES)
+            if stage in trace
+        }
+        if stages is None and trace.get("previous_fetch_start"):
+            latencies[POLL_GAP] = start - trace["previous_fetch_start"]
+
+        with self._lock:
+            windows = self._sessions.get(session_id)
+            if windows is None:
+                windows = self._sessions[session_id] = {}
+            for stage, latency in latencies.items():
+                self._global[stage].append(latency)
+                windows.setdefault(stage, deque(maxlen=self.window)).append(latency)
+
+        # Alert on what a viewer actually waited for
+        delivered = latencies.get("sse_write", latencies.get("enqueued"))
+        if self.alert_seconds and delivered and delivered > self.alert_seconds:
+            self.alerts += 1
+            print(
+                f"⚠️  Slow update [{session_id}]: {delivered:.1f}s from fetch to "
+                f"{'browser' if 'sse_write' in latencies else 'queue'}"
+            )
+
+    def forget(self, session_id: str):
+        """Drop the windows of a stopped session"""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def prune(self, live_session_ids: Set[str]):
+        """Drop the windows of every session not in ``live_session_ids``"""
+        with self._lock:
+            for session_id in list(self._sessions):
+                if session_id not in live_session_ids:
+                    del self._sessions[session_id]
+
+    def _summarize(self, windows: Dict[str, Deque[float]]) -> dict:
+        """Count and percentiles (seconds) for each stage with samples"""
+        summary = {}
+        for stage in STAGES + [POLL_GAP]:
+            values = sorted(windows.get(stage, ()))
+            if not values:
+                continue
+            summary[stage] = {"count": len(values)}
+            for pct in PERCENTILES:
+                summary[stage][f"p{pct}"] = round(_percentile(values, pct), 3)
+        return summary
+
+    def summary(self, session_id: Optional[str] = None) -> dict:
+        """Percentile summary for one session, or global plus per-session"""
+        with self._lock:
+            if session_id is not None:
+                windows = self._sessions.get(session_id, {})
+                return {"session_id": session_id, "stages": self._summarize(windows)}
+
+            report = {
+                "stages": self._summarize(self._global),
+                "sessions": {
+                    sid: self._summarize(windows)
+                    for sid, windows in self._sessions.items()
+                },
+            }
+
+        delivered = report["stages"].get("sse_write") or report["stages"].get(
+            "enqueued"
+        )
+        report["alert_seconds"] = self.alert_seconds or None
+        report["alerts"] = self.alerts
+        report["degraded"] = bool(
+            self.alert_seconds and delivered and delivered["p90"] > self.alert_seconds
+        )
+        return report
+
+
+# Shared by everything in the process
+freshness_tracker = FreshnessTracker(
+    alert_seconds=Config.from_env().freshness_alert_seconds
+)
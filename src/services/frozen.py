@@ -0,0 +1,204 @@
+"""
+Frozen, immutable snapshots of finished sessions served without the live pipeline
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+from ..config import Config
+from .memory import LRUCache, memory_registry
+
+# Finished data never changes, so browsers and proxies may keep it for a year
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class FrozenSnapshot(NamedTuple):
+    """A finished session's final status, gzipped JSON"""
+
+    session_id: str
+    etag: str  # SHA-256 of the canonical JSON
+    body: bytes  # gzip-compressed JSON
+
+
+def _isoformat(value) -> Optional[str]:
+    """Datetimes become ISO strings; strings (from the archive) pass through"""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def build_payload(session: dict) -> dict:
+    """
+    The frozen document: the fields of a live /api/status response, except
+    "archived", which changes after freezing and so can't be cached
+    """
+    return {
+        "session_id": session["id"],
+        "status": session["status"],
+        "created_at": _isoformat(session["created_at"]),
+        "last_update": _isoformat(session["last_update"]),
+        "data": session["data"],
+        "error": session.get("error"),
+    }
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (``gzip;q=0`` refuses it)"""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def response_parts(
+    frozen: FrozenSnapshot, if_none_match: str, accept_encoding: str
+) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Status, headers and body for serving a frozen snapshot
+
+    The stored gzip body goes out as is to clients that accept gzip, and a
+    matching If-None-Match gets an empty 304.
+    """
+    etag = f'"{frozen.etag}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or (
+        if_none_match.strip() == "*"
+    ):
+        return 304, headers, b""
+
+    headers["Content-Type"] = "application/json"
+    if accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        return 200, headers, frozen.body
+    return 200, headers, gzip.decompress(frozen.body)
+
+
+class FrozenArchive:
+    """
+    Content-hashed snapshots of finished sessions, on disk and in memory
+
+    A session is frozen once its status is "finished" and its tournament
+    reports every round complete: by the engine as it finishes, or on the
+    first read afterwards (e.g. on another host or after a restart). From
+    then on reads are a memory lookup checked against the file, or one small
+    file read, with no database query or JSON serialization.
+    """
+
+    def __init__(self, directory: str, cache_size: int = 256):
+        self.directory = directory
+        self._cache = LRUCache(cache_size)
+        memory_registry.register_cache("frozen_sessions", self._cache)
+
+    def _path(self, session_id: str) -> Optional[str]:
+        """File of a session's snapshot (None for IDs that aren't plain names)"""
+        if not session_id or os.path.basename(session_id) != session_id:
+            return None
+        return os.path.join(self.directory, f"{session_id}.json.gz")
+
+    def get(self, session_id: str) -> Optional[FrozenSnapshot]:
+        """A session's frozen snapshot, if it has been frozen"""
+        path = self._path(session_id)
+        if path is None:
+            return None
+
+        frozen = self._cache.get(session_id)
+        if frozen is not None:
+            # Another process may have discarded it (e.g. the session was stopped)
+            if os.path.exists(path):
+                return frozen
+            self._cache.pop(session_id, None)
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+            etag = hashlib.sha256(gzip.decompress(body)).hexdigest()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as e:
+            print(f"⚠️  Unreadable frozen snapshot {path}: {e}")
+            return None
+
+        frozen = self._cache[session_id] = FrozenSnapshot(session_id, etag, body)
+        return frozen
+
+    def freeze(self, session: Optional[dict]) -> Optional[FrozenSnapshot]:
+        """
+        Freeze a session if it is finished
+
+        Args:
+            session: Live or archived session dict
+
+        Returns:
+            The snapshot, or None if the session can still change
+        """
+        if not session or session["status"] != "finished":
+            return None
+        if not (session["data"] or {}).get("is_finished"):
+            return None
+
+        path = self._path(session["id"])
+        if path is None:
+            return None
+
+        document = json.dumps(
+            build_payload(session), sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        frozen = FrozenSnapshot(
+            session["id"],
+            hashlib.sha256(document).hexdigest(),
+            gzip.compress(document, compresslevel=9, mtime=0),
+        )
+
+        # Write-then-rename so readers never see a partial file
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(frozen.body)
+        os.replace(temp_path, path)
+
+        self._cache[session["id"]] = frozen
+        return frozen
+
+    def discard(self, session_id: str):
+        """Delete a session's snapshot (e.g. when the session is stopped)"""
+        self._cache.pop(session_id, None)
+        path = self._path(session_id)
+        if path is not None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def prune(self, max_age_days: int) -> int:
+        """Delete snapshot files older than ``max_age_days``; returns how many"""
+        if not max_age_days or not os.path.isdir(self.directory):
+            return 0
+
+        cutoff = time.time() - max_age_days * 86400
+        pruned = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json.gz") and entry.stat().st_mtime < cutoff:
+                self.discard(entry.name[: -len(".json.gz")])
+                pruned += 1
+        return pruned
+
+
+# Shared by everything in the process
+_config = Config.from_env()
+frozen_archive = FrozenArchive(_config.frozen_dir, _config.frozen_cache_size)
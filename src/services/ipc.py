@@ -0,0 +1,223 @@
+"""
+Local IPC channel between the monitor daemon and the web processes
+
+Peers authenticate with the shared MONITOR_IPC_AUTHKEY and then exchange
+length-prefixed JSON messages: ``[session_id, data]`` updates from the
+daemon and ``{"command": "rebalance"}`` / ``{"command": "stop",
+"session_id": ...}`` commands back. Nothing received is ever unpickled.
+"""
+
+import json
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, List, Optional, Union
+
+Address = Union[str, tuple]
+
+# Larger messages are treated as a broken peer
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# Command name -> string fields it must carry
+COMMANDS = {"rebalance": (), "stop": ("session_id",)}
+
+
+def check_authkey(authkey: str) -> bytes:
+    """The authkey as bytes; an empty one is refused"""
+    if not authkey:
+        raise ValueError(
+            "MONITOR_IPC_AUTHKEY must be set to a shared secret to use the "
+            "monitor daemon"
+        )
+    return authkey.encode()
+
+
+def send_message(conn: Connection, message):
+    """Send one JSON message"""
+    conn.send_bytes(json.dumps(message).encode("utf-8"))
+
+
+def recv_message(conn: Connection):
+    """Receive one JSON message (OSError if it is too large)"""
+    return json.loads(conn.recv_bytes(MAX_MESSAGE_BYTES))
+
+
+def is_valid_command(message) -> bool:
+    """Whether a received message is a known command with all its fields"""
+    if not isinstance(message, dict):
+        return False
+    fields = COMMANDS.get(message.get("command"))
+    return fields is not None and all(
+        isinstance(message.get(field), str) for field in fields
+    )
+
+
+def parse_address(address: str) -> Address:
+    """'host:port' becomes a TCP address, anything else a Unix socket path"""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        return (host or "127.0.0.1", int(port))
+    return address
+
+
+class EventPublisher:
+    """
+    Broadcasts (session_id, data) updates to every connected web process
+
+    Runs in the monitor daemon. Subscribers may also send commands back
+    (e.g. ``{"command": "rebalance"}`` after creating a session), which are
+    passed to ``on_command``; malformed ones are ignored.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        authkey: str,
+        on_command: Optional[Callable[[dict], None]] = None,
+    ):
+        self.address = parse_address(address)
+        self.authkey = check_authkey(authkey)
+        self.on_command = on_command
+        self.listener: Optional[Listener] = None
+        self.connections: List[Connection] = []
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+    def start(self):
+        """Start listening for subscribers"""
+        self.listener = Listener(self.address, authkey=self.authkey)
+        threading.Thread(
+            target=self._accept_loop, name="ipc-accept", daemon=True
+        ).start()
+        print(f"📡 Publishing updates on {self.address}")
+
+    def _accept_loop(self):
+        """Accept subscriber connections"""
+        while self.listener is not None:
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                # Listener closed
+                break
+            except Exception as e:
+                print(f"⚠️  Rejected IPC subscriber: {e}")
+                continue
+
+            with self._lock:
+                self.connections.append(conn)
+            threading.Thread(
+                target=self._read_loop, args=(conn,), name="ipc-read", daemon=True
+            ).start()
+
+    def _read_loop(self, conn: Connection):
+        """Receive commands from one subscriber"""
+        try:
+            while True:
+                command = recv_message(conn)
+                if not is_valid_command(command):
+                    print(f"⚠️  Ignored malformed IPC command: {command!r:.200}")
+                    continue
+                if self.on_command:
+                    self.on_command(command)
+        except (EOFError, OSError, ValueError, TypeError, KeyError, IndexError):
+            pass
+        finally:
+            self._drop(conn)
+
+    def _drop(self, conn: Connection):
+        """Forget a disconnected subscriber"""
+        with self._lock:
+            if conn in self.connections:
+                self.connections.remove(conn)
+        conn.close()
+
+    def publish(self, session_id: str, data: dict):
+        """Send an update to every subscriber"""
+        with self._lock:
+            connections = list(self.connections)
+        # Update workers publish concurrently; keep messages whole
+        with self._send_lock:
+            for conn in connections:
+                try:
+                    send_message(conn, [session_id, data])
+                except (OSError, ValueError):
+                    self._drop(conn)
+
+    def close(self):
+        """Stop listening and disconnect all subscribers"""
+        listener, self.listener = self.listener, None
+        if listener:
+            listener.close()
+        with self._lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
+
+
+class EventSubscriber:
+    """
+    Receives updates from one or more monitor daemons
+
+    Runs in each web process. Connections are retried with backoff, so the
+    web tier and the daemons can be started and restarted in any order.
+    """
+
+    def __init__(
+        self,
+        addresses: List[str],
+        authkey: str,
+        on_event: Callable[[str, dict], None],
+    ):
+        self.addresses = [parse_address(address) for address in addresses]
+        self.authkey = check_authkey(authkey)
+        self.on_event = on_event
+        self.connections: List[Connection] = []
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+    def start(self):
+        """Connect to every daemon in the background"""
+        for address in self.addresses:
+            threading.Thread(
+                target=self._connect_loop, args=(address,), name="ipc-sub", daemon=True
+            ).start()
+
+    def _connect_loop(self, address: Address):
+        """Keep a connection to one daemon open and dispatch its updates"""
+        delay = 1
+        while True:
+            try:
+                conn = Client(address, authkey=self.authkey)
+            except (OSError, EOFError, AuthenticationError) as e:
+                print(f"⚠️  Monitor daemon at {address} unavailable: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, 30)
+                continue
+
+            print(f"📡 Subscribed to monitor daemon at {address}")
+            delay = 1
+            with self._lock:
+                self.connections.append(conn)
+            try:
+                while True:
+                    session_id, data = recv_message(conn)
+                    self.on_event(session_id, data)
+            except (EOFError, OSError, ValueError, TypeError):
+                print(f"⚠️  Lost connection to monitor daemon at {address}")
+            finally:
+                with self._lock:
+                    if conn in self.connections:
+                        self.connections.remove(conn)
+                conn.close()
+
+    def send_command(self, command: dict):
+        """Send a command to every connected daemon"""
+        with self._lock:
+            connections = list(self.connections)
+        with self._send_lock:
+            for conn in connections:
+                try:
+                    send_message(conn, command)
+                except (OSError, ValueError):
+                    pass
@@ -0,0 +1,175 @@
+"""
+Session leasing so monitors are sharded across processes and hosts
+"""
+
+import math
+import os
+import socket
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional, Set
+from ..database import Database, lease_key
+
+
+def make_owner_id() -> str:
+    """Unique ID for this monitor process"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaseManager:
+    """
+    Claims, renews and releases session leases for one monitor process
+
+    The unit of leasing is a player: all sessions watching the same player
+    are claimed, held and released together, so each player page is polled
+    by one process only. Every ``lease_seconds / 3`` the manager heartbeats,
+    renews the leases it holds, picks up new sessions of the players it
+    holds and claims unowned or expired players up to its fair share
+    (active players divided by live processes). When it holds more than its
+    share it releases one player per cycle so others can pick it up. A
+    process that dies simply stops renewing, and its players are claimed by
+    the survivors once their leases expire.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        on_claim: Callable[[dict, float], None],
+        on_release: Callable[[str], None],
+        lease_seconds: int = 60,
+        owner_id: Optional[str] = None,
+    ):
+        self.db = db
+        self.on_claim = on_claim
+        self.on_release = on_release
+        self.lease_seconds = lease_seconds
+        self.owner_id = owner_id or make_owner_id()
+        # session ID -> player key (see database.lease_key)
+        self.owned: Dict[str, str] = {}
+        # Reentrant: on_release may call release() while stop() holds the lock
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the background lease loop"""
+        self._thread = threading.Thread(
+            target=self._run, name="lease-manager", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the lease loop and hand all sessions back"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+        with self._lock:
+            for session_id in list(self.owned):
+                self.on_release(session_id)
+            self.owned.clear()
+        self.db.remove_owner(self.owner_id)
+
+    def owned_players(self) -> Dict[str, List[str]]:
+        """Held session IDs grouped by player key"""
+        players: Dict[str, List[str]] = {}
+        with self._lock:
+            for session_id, key in self.owned.items():
+                players.setdefault(key, []).append(session_id)
+        return players
+
+    def _take(self, session: dict, initial_delay: float = 0):
+        """Record a newly claimed session and start monitoring it"""
+        with self._lock:
+            self.owned[session["id"]] = lease_key(session["config"])
+        print(f"🔒 Claimed session: {session['id']}")
+        self.on_claim(session, initial_delay)
+
+    def claim(self, session_ids: List[str]) -> Set[str]:
+        """
+        Claim specific sessions right away (e.g. ones just created here)
+
+        Unowned sessions of the same players come along and are started
+        through ``on_claim``. Sessions of players another process holds are
+        left to that process.
+        """
+        requested = set(session_ids)
+        claimed = self.db.claim_sessions(
+            self.owner_id, self.lease_seconds, None, session_ids=session_ids
+        )
+        with self._lock:
+            for session in claimed:
+                self.owned[session["id"]] = lease_key(session["config"])
+        for session in claimed:
+            if session["id"] not in requested:
+                print(f"🔒 Claimed session: {session['id']}")
+                self.on_claim(session, 0)
+        return {session["id"] for session in claimed} & requested
+
+    def release(self, session_id: str):
+        """Give up a session this process no longer monitors"""
+        with self._lock:
+            self.owned.pop(session_id, None)
+        self.db.release_lease(session_id, self.owner_id)
+
+    def _run(self):
+        """Lease loop"""
+        interval = max(1, self.lease_seconds / 3)
+        while not self._stop.is_set():
+            try:
+                self.rebalance()
+            except Exception as e:
+                print(f"⚠️  Lease manager error: {e}")
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    def wake(self):
+        """Run the next lease cycle now, e.g. to pick up a new session quickly"""
+        self._wake.set()
+
+    def rebalance(self):
+        """Heartbeat, renew held leases and move towards the fair share"""
+        self.db.heartbeat_owner(self.owner_id)
+
+        with self._lock:
+            owned = set(self.owned)
+
+        # Renew, and stop monitoring anything another process took over
+        still_owned = self.db.renew_leases(self.owner_id, owned, self.lease_seconds)
+        for session_id in owned - still_owned:
+            print(f"🔓 Lease lost for session: {session_id}")
+            with self._lock:
+                self.owned.pop(session_id, None)
+            self.on_release(session_id)
+
+        # New sessions of players held here join them, whatever the share
+        held = list(self.owned_players())
+        if held:
+            for session in self.db.claim_sessions(
+                self.owner_id, self.lease_seconds, None, player_keys=held
+            ):
+                self._take(session)
+
+        live_owners = max(1, self.db.count_live_owners(self.lease_seconds))
+        fair_share = math.ceil(self.db.count_active_players() / live_owners)
+        players = self.owned_players()
+
+        if len(players) < fair_share:
+            claimed = self.db.claim_sessions(
+                self.owner_id, self.lease_seconds, fair_share - len(players)
+            )
+            # Stagger first polls of a batch across the check interval
+            for i, session in enumerate(claimed):
+                initial_delay = session["config"]["check_interval"] * i / len(claimed)
+                self._take(session, initial_delay)
+
+        elif len(players) > fair_share:
+            key, session_ids = next(iter(players.items()))
+            print(
+                f"↪️  Releasing player for rebalancing: {key} "
+                f"({len(session_ids)} sessions)"
+            )
+            for session_id in session_ids:
+                self.on_release(session_id)
+                self.release(session_id)
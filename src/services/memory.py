@@ -0,0 +1,222 @@
+"""
+Memory accounting and bounded-memory mode for long-running instances
+"""
+
+import ctypes
+import gc
+import os
+import threading
+import tracemalloc
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+# Allocation sites are attributed to the first matching path fragment
+SUBSYSTEMS = [
+    ("beautifulsoup", ("/bs4/", "/soupsieve/", "html/parser")),
+    ("parsers", ("/src/parsers/",)),
+    ("monitor", ("/src/services/monitor", "/src/services/standings")),
+    ("services", ("/src/services/",)),
+    ("http", ("/requests/", "/urllib3/", "/aiohttp/", "/ssl.py", "/http/")),
+    ("database", ("/sqlalchemy/", "/sqlite3/", "/psycopg2/", "/src/database")),
+    ("web", ("/flask/", "/werkzeug/", "/jinja2/", "/gunicorn/")),
+    ("json", ("/json/",)),
+]
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (0 if unknown)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _release_free_memory():
+    """Ask glibc to hand freed heap pages back to the OS"""
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class LRUCache:
+    """Thread-safe dict with least-recently-used eviction"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._data) > self.max_entries:
+                    self._data.popitem(last=False)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def items(self):
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def evict(self, fraction: float) -> int:
+        """Drop the least recently used ``fraction`` of entries"""
+        with self._lock:
+            count = max(1, int(len(self._data) * fraction)) if self._data else 0
+            for _ in range(count):
+                self._data.popitem(last=False)
+            return count
+
+
+class MemoryRegistry:
+    """
+    Process-wide registry of caches and gauges for memory accounting
+
+    Caches are held weakly, so a monitor's caches disappear from the
+    registry when the monitor does. When a memory budget is set, a
+    background thread evicts registered caches LRU-first whenever RSS
+    goes over it.
+    """
+
+    def __init__(self):
+        self._caches: Dict[str, weakref.WeakSet] = {}
+        self._gauges: Dict[str, Callable[[], int]] = {}
+        self._lock = threading.Lock()
+        self.budget_bytes = 0
+        self.evictions = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register_cache(self, subsystem: str, cache: LRUCache):
+        """Track a cache under a subsystem name"""
+        with self._lock:
+            self._caches.setdefault(subsystem, weakref.WeakSet()).add(cache)
+
+    def register_gauge(self, name: str, fn: Callable[[], int]):
+        """Track a number (e.g. queue count) reported by ``fn``"""
+        with self._lock:
+            self._gauges[name] = fn
+
+    def start(self, tracing: bool, budget_mb: int, check_interval: int = 30):
+        """Enable tracemalloc and/or the memory budget"""
+        if tracing and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.budget_bytes = budget_mb * 1024 * 1024
+        if self.budget_bytes and self._thread is None:
+            self._thread = threading.Thread(
+                target=self._enforce_budget,
+                args=(check_interval,),
+                name="memory-budget",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the budget thread"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _enforce_budget(self, check_interval: int):
+        """Evict caches while RSS is over budget"""
+        while not self._stop.wait(check_interval):
+            try:
+                if current_rss() > self.budget_bytes:
+                    self.shrink()
+            except Exception as e:
+                print(f"⚠️  Memory budget error: {e}")
+
+    def shrink(self, fraction: float = 0.25) -> int:
+        """Evict the least recently used part of every cache and free memory"""
+        with self._lock:
+            caches = [cache for group in self._caches.values() for cache in group]
+        evicted = sum(cache.evict(fraction) for cache in caches)
+        gc.collect()
+        _release_free_memory()
+        self.evictions += evicted
+        if evicted:
+            print(f"🧹 Memory over budget, evicted {evicted} cache entries")
+        return evicted
+
+    def report(self, top: int = 10) -> dict:
+        """Memory usage per subsystem, cache sizes and gauges"""
+        with self._lock:
+            caches = {
+                subsystem: {
+                    "caches": len(group),
+                    "entries": sum(len(cache) for cache in group),
+                }
+                for subsystem, group in self._caches.items()
+            }
+            gauges = dict(self._gauges)
+
+        report = {
+            "rss_bytes": current_rss(),
+            "budget_bytes": self.budget_bytes or None,
+            "evictions": self.evictions,
+            "caches": caches,
+            "gauges": {name: fn() for name, fn in gauges.items()},
+            "tracing": tracemalloc.is_tracing(),
+        }
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            by_subsystem: Dict[str, int] = {}
+            stats = tracemalloc.take_snapshot().statistics("filename")
+            for stat in stats:
+                filename = stat.traceback[0].filename
+                subsystem = next(
+                    (
+                        name
+                        for name, fragments in SUBSYSTEMS
+                        if any(fragment in filename for fragment in fragments)
+                    ),
+                    "other",
+                )
+                by_subsystem[subsystem] = by_subsystem.get(subsystem, 0) + stat.size
+
+            report["traced_bytes"] = current
+            report["traced_peak_bytes"] = peak
+            report["subsystems"] = dict(
+                sorted(by_subsystem.items(), key=lambda item: -item[1])
+            )
+            report["top_files"] = [
+                {"file": stat.traceback[0].filename, "bytes": stat.size}
+                for stat in stats[:top]
+            ]
+
+        return report
+
+
+# Shared by everything in the process
+memory_registry = MemoryRegistry()
@@ -2,69 +2,448 @@
 Tournament monitoring service
 """
 
+import copy
 import time
-from typing import Optional, Dict, Tuple
+import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Set, Tuple
 from ..config import Config
 from ..api.client import ChessResultsClient
+from ..api.async_client import AsyncChessResultsClient
 from ..parsers.tournament_parser import TournamentParser
+from ..parsers.parse_pool import get_parse_executor
 from ..models.tournament import Tournament
 from ..models.match import Match
+from .circuit_breaker import get_breaker
+from .standings import standings_fetcher
+from .opponent_profiles import opponent_profiles
+from .crosstable import crosstables
+from .rating_change import rating_changes
+from .memory import LRUCache, memory_registry
+from .freshness import stamp
+from .cancellation import CancellationToken, Cancelled
+
+# Shared by all monitors for background round page fetches
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="round-prefetch")
+
+# (server, tournament_id, round) -> (fetched_at, pairings): each fetched page is
+# parsed and folded into the crosstable once, then shared by the tournament's
+# sessions for a poll interval
+_round_pages = LRUCache(256)
+memory_registry.register_cache("round_pages", _round_pages)
+
+
+def diff_states(old: Optional[Tournament], tournament: Tournament) -> List[dict]:
+    """
+    List what changed between two states of a player, for the history log
+
+    Returns:
+        list: Dicts with "type" ("pairing", "result" or "rank") and the
+            affected "round", new "value" and "previous" value
+    """
+    new_rank = tournament.player.current_rank
+
+    # First observation: only the rank is a meaningful starting point
+    if old is None:
+        return [{"type": "rank", "value": new_rank}] if new_rank else []
+
+    changes = []
+    old_matches = {m.round_number: m for m in old.matches}
+    for match in tournament.matches:
+        old_match = old_matches.get(match.round_number)
+        if old_match is None:
+            changes.append(
+                {
+                    "type": "pairing",
+                    "round": match.round_number,
+                    "value": match.opponent_snr,
+                    "details": {
+                        "opponent_name": match.opponent_name,
+                        "board_number": match.board_number,
+                    },
+                }
+            )
+            if match.result:
+                changes.append(
+                    {
+                        "type": "result",
+                        "round": match.round_number,
+                        "value": match.result,
+                    }
+                )
+        elif match.result != old_match.result:
+            changes.append(
+                {
+                    "type": "result",
+                    "round": match.round_number,
+                    "value": match.result,
+                    "previous": old_match.result,
+                }
+            )
+
+    if new_rank != old.player.current_rank:
+        changes.append(
+            {
+                "type": "rank",
+                "value": new_rank,
+                "previous": old.player.current_rank,
+            }
+        )
+
+    return changes
 
 
 class TournamentMonitor:
     """Monitors a chess tournament and detects changes"""
 
-    def __init__(self, config: Config, client: ChessResultsClient):
+    def __init__(
+        self,
+        config: Config,
+        client: ChessResultsClient,
+        token: Optional[CancellationToken] = None,
+    ):
         self.config = config
         self.client = client
+        self.token = token or CancellationToken()
         self.parser = TournamentParser()
+        # round number -> (color, pairing); at most one entry per round, and
+        # never evicted: a missing round would be republished without its color
         self.pairing_cache: Dict[str, Tuple[Optional[str], str]] = {}
         self.last_tournament_state: Optional[Tournament] = None
         self.last_round_count: int = 0
+        # Last state stored by an earlier run, the baseline for the first diff
+        self.stored_state: Optional[Tournament] = None
+        # round number -> player's color, from round pages fetched in the background
+        self.prefetched_colors: Dict[str, str] = {}
+        self._prefetching: Set[str] = set()
+        self._prefetch_lock = threading.Lock()
+        self.prefetch_ready = threading.Event()
+        # Cancelling also ends the wait for background colors
+        self.token.on_cancel(self.prefetch_ready.set)
+        # Stage timestamps of the latest poll, for freshness tracing
+        self.last_trace: Dict[str, float] = {}
+        # Whether the latest poll failed because the host didn't answer
+        self.host_unavailable = False
 
     def fetch_current_state(self) -> Optional[Tournament]:
         """Fetch the current tournament state"""
-        soup = self.client.fetch_player_page()
-        if not soup:
+        trace = {"fetch_start": time.time()}
+        if self.last_trace:
+            trace["previous_fetch_start"] = self.last_trace["fetch_start"]
+
+        self.host_unavailable = False
+        html = self.client.fetch_player_html()
+        stamp(trace, "fetch_end")
+        if not html:
+            self.host_unavailable = self.client.host_unavailable
             return None
 
-        tournament = self.parser.parse_tournament_state(
-            soup, self.config.tournament_id, self.config.player_snr
+        tournament = get_parse_executor().parse_tournament_state(
+            html, self.config.tournament_id, self.config.player_snr
         )
+        stamp(trace, "parse_end")
 
         if not tournament:
             return None
+        self.token.raise_if_cancelled()
+
+        # Rank and points come from the shared tournament standings
+        self._apply_standings(tournament)
+
+        # Rounds whose color is already known from a background fetch
+        for match in tournament.matches:
+            self._use_prefetched_color(match)
+
+        missing_rounds = [
+            int(match.round_number)
+            for match in tournament.matches
+            if match.opponent_snr
+            and match.round_number.isdigit()
+            and match.round_number not in self.pairing_cache
+        ]
+
+        if self.last_tournament_state is None:
+            # First load: fetch all missing round pages in parallel before
+            # enriching, except those another session fetched just now
+            round_pages = self._fetch_round_pages(
+                [r for r in missing_rounds if self._cached_round(str(r)) is None]
+            )
+        else:
+            # New pairing mid-tournament: publish it now, color follows when fetched
+            for round_num in missing_rounds:
+                self._prefetch_round(round_num)
+            round_pages = None
 
         # Enrich matches with color information
         for match in tournament.matches:
-            if match.opponent_snr and match.round_number:
-                color, pairing = self._get_color_and_pairing(
-                    match.round_number, match.opponent_snr
-                )
-                match.color = color
-                match.pairing = pairing
+            if not (match.opponent_snr and match.round_number):
+                continue
+            if round_pages is None and match.round_number not in self.pairing_cache:
+                match.pairing = f"{self.config.player_snr}-{match.opponent_snr}"
+                continue
+            color, pairing = self._get_color_and_pairing(
+                match.round_number, match.opponent_snr, round_pages
+            )
+            match.color = color
+            match.pairing = pairing
+
+        # Results are in: fetch the next round's pairings as soon as they appear
+        if (
+            tournament.matches
+            and all(match.is_completed() for match in tournament.matches)
+            and len(tournament.matches) < tournament.total_rounds
+        ):
+            self._prefetch_round(len(tournament.matches) + 1)
+
+        self.token.raise_if_cancelled()
+        self._apply_profiles(tournament)
+        self._apply_rating_changes(tournament)
+        self._apply_crosstable(tournament)
 
+        stamp(trace, "enriched")
+        self.last_trace = trace
         return tournament
 
+    def _apply_standings(self, tournament: Tournament):
+        """Overwrite rank and points with the tournament-wide standings"""
+        standings = standings_fetcher.get_standings(self.client)
+        if not standings:
+            return
+
+        entry = standings.get(self.config.player_snr)
+        if entry:
+            tournament.player.current_rank = entry["rank"]
+            if entry["points"]:
+                tournament.player.points = entry["points"]
+
+    def _use_prefetched_color(self, match: Match):
+        """Move a background-fetched color into the pairing cache for a match"""
+        color = self.prefetched_colors.get(match.round_number)
+        if not color or not match.opponent_snr:
+            return
+
+        player, opponent = self.config.player_snr, match.opponent_snr
+        pairing = f"{player}-{opponent}" if color == "White" else f"{opponent}-{player}"
+        self.pairing_cache[match.round_number] = (color, pairing)
+        del self.prefetched_colors[match.round_number]
+
+    def _prefetch_round(self, round_num: int):
+        """Fetch a round page in the background unless already in flight"""
+        key = str(round_num)
+        with self._prefetch_lock:
+            if key in self._prefetching or key in self.prefetched_colors:
+                return
+            self._prefetching.add(key)
+
+        try:
+            _prefetch_pool.submit(self._prefetch_worker, key)
+        except RuntimeError:
+            # Interpreter shutting down
+            with self._prefetch_lock:
+                self._prefetching.discard(key)
+
+    def _prefetch_worker(self, round_num: str):
+        """Fetch a round page for its results and the player's color (runs on the prefetch pool)"""
+        try:
+            if self.token.cancelled:
+                return
+            breaker = get_breaker(
+                self.config.get_host(),
+                self.config.breaker_failure_threshold,
+                self.config.breaker_reset_timeout,
+            )
+            if breaker.is_open():
+                return
+
+            pairings = self._cached_round(round_num)
+            if pairings is None:
+                with ChessResultsClient(self.config) as client:
+                    html = client.fetch_round_html(int(round_num))
+                if not html:
+                    return
+                pairings = self._store_round_page(round_num, html)
+
+            if round_num in self.pairing_cache:
+                return
+
+            # Pairings may not be published yet; then the player isn't on the page
+            color, _ = self.parser.color_from_pairings(
+                pairings, self.config.player_snr, ""
+            )
+            if color:
+                self.prefetched_colors[round_num] = color
+                self.prefetch_ready.set()
+
+        except Exception as e:
+            print(f"⚠️  Round {round_num} prefetch failed: {e}")
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(round_num)
+
+    def apply_prefetched_colors(self) -> Optional[Tournament]:
+        """
+        Fill in colors that arrived since the last update
+
+        Returns:
+            A copy of the last state with the new colors, or None if none of
+            its matches gained a color
+        """
+        self.prefetch_ready.clear()
+        if self.last_tournament_state is None:
+            return None
+
+        tournament = copy.deepcopy(self.last_tournament_state)
+        updated = False
+        for match in tournament.matches:
+            if match.color is None:
+                self._use_prefetched_color(match)
+                if match.round_number in self.pairing_cache:
+                    match.color, match.pairing = self.pairing_cache[match.round_number]
+                    updated = match.color is not None or updated
+
+        return tournament if updated else None
+
+    def _apply_rating_changes(self, tournament: Tournament):
+        """Fill per-game and total Elo changes from the tournament-wide batch"""
+        if not rating_changes.submit(self.config.server, tournament):
+            return
+
+        changes = rating_changes.get(
+            self.config.server, self.config.tournament_id, self.config.player_snr
+        )
+        if not changes:
+            return
+
+        tournament.player.rating_change = changes["total"]
+        for match in tournament.matches:
+            game = changes["rounds"].get(match.round_number)
+            match.rating_change = game["delta"] if game else None
+
+    def _cached_round(self, round_num: str) -> Optional[List[dict]]:
+        """Pairings of a round page fetched within the last poll interval"""
+        key = (self.config.server, self.config.tournament_id, round_num)
+        cached = _round_pages.get(key)
+        if cached and time.monotonic() - cached[0] < self.config.check_interval:
+            return cached[1]
+        return None
+
+    def _store_round_page(self, round_num: str, html: bytes) -> List[dict]:
+        """Parse a fetched round page once, into the crosstable and the shared cache"""
+        pairings = get_parse_executor().parse_round_pairings(html)
+        key = (self.config.server, self.config.tournament_id, round_num)
+        _round_pages[key] = (time.monotonic(), pairings)
+        try:
+            crosstables.ingest(
+                self.config.server, self.config.tournament_id, int(round_num), pairings
+            )
+        except Exception as e:
+            print(f"⚠️  Crosstable update failed for Round {round_num}: {e}")
+        return pairings
+
+    def _apply_crosstable(self, tournament: Tournament):
+        """Attach local tiebreaks and refresh rounds whose results are still coming in"""
+        server, tournament_id = self.config.server, self.config.tournament_id
+
+        # Round pages are fetched at pairing time, before any result is on them.
+        # Refetch the latest finished rounds until every board has a result;
+        # _prefetch_round shares each fetch with the tournament's other sessions
+        completed = [
+            int(match.round_number)
+            for match in tournament.matches
+            if match.is_completed() and match.round_number.isdigit()
+        ]
+        for round_num in completed[-2:]:
+            if crosstables.is_pending(server, tournament_id, round_num):
+                self._prefetch_round(round_num)
+
+        table = crosstables.get(server, tournament_id)
+        if table is not None:
+            tournament.player.tiebreaks = table.tiebreaks(self.config.player_snr)
+
+    def _apply_profiles(self, tournament: Tournament):
+        """
+        Fill opponent fields the player's round table lacks from the shared cache
+
+        The round table already lists each opponent's rating, federation and
+        title, so a profile page is only fetched for opponents missing a
+        rating or federation there (e.g. unrated players).
+        """
+        for match in tournament.matches:
+            if not match.opponent_snr.isdigit():
+                continue
+            if match.opponent_rating and match.opponent_federation:
+                continue
+
+            profile = opponent_profiles.get(self.config, match.opponent_snr)
+            if profile:
+                match.opponent_rating = match.opponent_rating or profile["rating"]
+                match.opponent_federation = (
+                    match.opponent_federation or profile["federation"]
+                )
+                match.opponent_title = match.opponent_title or profile["title"]
+
+    def _fetch_round_pages(self, round_nums: List[int]) -> Dict[str, Optional[bytes]]:
+        """Fetch several round pages concurrently, keyed by round number string"""
+        if not round_nums:
+            return {}
+
+        print(
+            f"⏳ Fetching pairing info for Rounds {', '.join(map(str, round_nums))}...",
+            flush=True,
+        )
+
+        async def fetch():
+            # Stopping the monitor cancels the requests still in flight
+            loop = asyncio.get_running_loop()
+            task = asyncio.current_task()
+            unregister = self.token.on_cancel(
+                lambda: loop.call_soon_threadsafe(task.cancel)
+            )
+            try:
+                async with AsyncChessResultsClient(self.config) as async_client:
+                    return await async_client.fetch_round_htmls(round_nums)
+            finally:
+                unregister()
+
+        self.token.raise_if_cancelled()
+        try:
+            pages = asyncio.run(fetch())
+        except asyncio.CancelledError:
+            raise Cancelled()
+        except Exception as e:
+            print(f"⚠️  Parallel round fetch failed: {e}")
+            return {}
+
+        return {str(round_num): html for round_num, html in pages.items()}
+
     def _get_color_and_pairing(
-        self, round_num: str, opponent_snr: str
+        self,
+        round_num: str,
+        opponent_snr: str,
+        round_pages: Optional[Dict[str, Optional[bytes]]] = None,
     ) -> Tuple[Optional[str], str]:
         """Get color and pairing string for a match (with caching)"""
         # Check cache first
         if round_num in self.pairing_cache:
             return self.pairing_cache[round_num]
 
-        # Fetch from API
-        print(f"⏳ Fetching pairing info for Round {round_num}...", flush=True)
-        soup = self.client.fetch_round_page(int(round_num))
-
-        if soup:
-            color, pairing = self.parser.parse_color_from_round_page(
-                soup, self.config.player_snr, opponent_snr
-            )
+        # Use a page fetched in the parallel batch or shared by another
+        # session, else fetch from API
+        if round_pages and round_num in round_pages:
+            html = round_pages[round_num]
+            pairings = self._store_round_page(round_num, html) if html else []
         else:
-            color = None
-            pairing = f"{self.config.player_snr}-{opponent_snr}"
+            pairings = self._cached_round(round_num)
+            if pairings is None:
+                print(f"⏳ Fetching pairing info for Round {round_num}...", flush=True)
+                html = self.client.fetch_round_html(int(round_num))
+                pairings = self._store_round_page(round_num, html) if html else []
+
+        color, pairing = self.parser.color_from_pairings(
+            pairings, self.config.player_snr, opponent_snr
+        )
 
         # Cache the result
         self.pairing_cache[round_num] = (color, pairing)
@@ -94,6 +473,14 @@ class TournamentMonitor:
         ):
             if new_match.result != old_match.result:
                 return True
+            if new_match.color != old_match.color:
+                return True
+            # Opponent profiles arrive in the background after the pairing
+            if new_match.opponent_rating != old_match.opponent_rating:
+                return True
+
+        # Tiebreaks are left out: they move whenever any board in the tournament
+        # gets a result, and go out with the player's next change instead
 
         # Compare ranks
         if (
@@ -104,56 +491,110 @@ class TournamentMonitor:
 
         return False
 
+    def detect_changes(self, tournament: Tournament) -> List[dict]:
+        """
+        List what changed since the last check, for the history log
+
+        The first poll is compared with ``stored_state``, the state saved
+        before this monitor started (e.g. before a restart or lease handover).
+
+        Returns:
+            list: Dicts with "type" ("pairing", "result" or "rank") and the
+                affected "round", new "value" and "previous" value
+        """
+        return diff_states(self.last_tournament_state or self.stored_state, tournament)
+
     def update_state(self, tournament: Tournament):
         """Update the stored tournament state"""
         self.last_tournament_state = tournament
         self.last_round_count = len(tournament.matches)
 
-    def run(self, callback=None):
+    def get_backoff_delay(self, attempt: int) -> float:
+        """Jittered exponential backoff delay (seconds) for a failure attempt"""
+        delay = min(
+            self.config.max_backoff,
+            self.config.check_interval * (2 ** min(attempt - 1, 16)),
+        )
+        # Equal jitter keeps sessions from retrying in lockstep
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def run(self, callback=None, initial_delay: float = 0):
         """
         Main monitoring loop
 
+        Runs until the tournament finishes or ``self.token`` is cancelled;
+        cancelling interrupts any sleep and skips the rest of a poll.
+
         Args:
-            callback: Optional function called on each update with (tournament, new_round)
+            callback: Optional function called on each update with
+                (tournament, new_round, trace=...); trace is the poll's stage
+                timestamps, and None for colors published between polls
+            initial_delay: Seconds to wait before the first poll, used to
+                stagger sessions that start together
         """
         print("⏳ Starting monitor... (Press Ctrl+C to stop)\n")
 
+        breaker = get_breaker(
+            self.config.get_host(),
+            self.config.breaker_failure_threshold,
+            self.config.breaker_reset_timeout,
+        )
         consecutive_failures = 0
         max_failures = 5
 
         try:
-            while True:
+            if initial_delay > 0:
+                self.token.sleep(initial_delay)
+
+            while not self.token.cancelled:
                 try:
-                    tournament = self.fetch_current_state()
+                    # Skip the poll cheaply while the host is known to be down
+                    if not breaker.allow_request():
+                        self.token.sleep(self.config.check_interval)
+                        continue
+
+                    try:
+                        tournament = self.fetch_current_state()
+                    finally:
+                        # Only the host failing to answer counts against its
+                        # breaker; a page that won't parse (bad URL, wrong SNR)
+                        # must not stop polling for every session on the server.
+                        # A stopped poll says nothing about the host either
+                        if self.token.cancelled:
+                            breaker.release_probe()
+                        elif self.host_unavailable:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
 
                     if not tournament:
                         consecutive_failures += 1
+                        delay = self.get_backoff_delay(consecutive_failures)
                         print(
-                            f"\n⚠️  Failed to fetch tournament data (attempt {consecutive_failures}/{max_failures})"
+                            f"\n⚠️  Failed to fetch tournament data (attempt {consecutive_failures}), retrying in {delay:.0f}s"
                         )
 
-                        # Send error via callback if too many failures
-                        if consecutive_failures >= max_failures:
-                            error_msg = f"Failed to fetch tournament data after {max_failures} attempts. Check network connection or tournament URL."
+                        # Send error via callback every max_failures attempts
+                        if consecutive_failures % max_failures == 0:
+                            error_msg = f"Failed to fetch tournament data after {consecutive_failures} attempts. Check network connection or tournament URL."
                             print(f"❌ {error_msg}")
                             if callback:
                                 # Send error as a special update
                                 callback(None, None, error=error_msg)
-                            # Reset counter and continue trying
-                            consecutive_failures = 0
 
-                        time.sleep(self.config.check_interval)
+                        self.token.sleep(delay)
                         continue
 
                     # Reset failure counter on success
                     consecutive_failures = 0
 
                     # Check if state has changed
+                    self.token.raise_if_cancelled()
                     if self.has_state_changed(tournament):
                         new_round = self.detect_new_round(tournament)
 
                         if callback:
-                            callback(tournament, new_round)
+                            callback(tournament, new_round, trace=self.last_trace)
 
                         self.update_state(tournament)
 
@@ -171,9 +612,23 @@ class TournamentMonitor:
                 except Exception as e:
                     print(f"\n❌ Error during monitoring: {e}")
 
-                time.sleep(self.config.check_interval)
+                # Wake early to publish colors fetched in the background
+                next_poll = time.monotonic() + self.config.check_interval
+                while self.prefetch_ready.wait(max(0.0, next_poll - time.monotonic())):
+                    if self.token.cancelled:
+                        break
+                    tournament = self.apply_prefetched_colors()
+                    if tournament:
+                        if callback:
+                            callback(tournament, None)
+                        self.update_state(tournament)
 
         except KeyboardInterrupt:
             print("\n\n⏹️  Monitoring stopped by user.")
+        except Cancelled:
+            pass
+
+        if self.token.cancelled:
+            print("\n⏹️  Monitoring stopped.")
 
         print("\n✅ Program ended.")
@@ -0,0 +1,105 @@
+"""
+Opponent profiles (rating, federation, title) shared across all sessions
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set, Tuple
+from ..config import Config
+from ..api.client import ChessResultsClient
+from ..parsers.parse_pool import get_parse_executor
+from .circuit_breaker import get_breaker
+from .memory import LRUCache, memory_registry
+
+Profile = Dict[str, Optional[str]]
+ProfileKey = Tuple[str, str, str]  # (server, tournament_id, snr)
+
+
+class OpponentProfileCache:
+    """
+    Caches opponent profiles per (tournament, SNR) and fills them lazily
+
+    Only needed for opponents whose rating or federation is missing from
+    the watched player's round table.
+
+    Lookups never fetch: a missing or expired profile is queued for a
+    background worker and the caller gets whatever is cached (possibly
+    nothing), so enrichment never delays a poll. Every session in the
+    process shares the cache, so each opponent's page is fetched once per
+    TTL no matter how many watched players meet them.
+    """
+
+    def __init__(self):
+        config = Config.from_env()
+        self.ttl = config.profile_ttl
+        # (server, tournament_id, snr) -> (fetched_at, profile)
+        self._cache = LRUCache(config.profile_cache_size)
+        memory_registry.register_cache("opponent_profiles", self._cache)
+        self._pending: Set[ProfileKey] = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, config.profile_workers),
+            thread_name_prefix="profile-fill",
+        )
+
+    def get(self, config: Config, snr: str) -> Optional[Profile]:
+        """Get an opponent's cached profile, scheduling a fill if missing or stale"""
+        key = (config.server, config.tournament_id, snr)
+        cached = self._cache.get(key)
+
+        if cached is None or time.monotonic() - cached[0] >= self.ttl:
+            self._schedule(key, config)
+
+        return cached[1] if cached else None
+
+    def _schedule(self, key: ProfileKey, config: Config):
+        """Queue a background fill unless one is already pending for the key"""
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+
+        try:
+            self._pool.submit(self._fill, key, config)
+        except RuntimeError:
+            # Interpreter shutting down
+            with self._lock:
+                self._pending.discard(key)
+
+    def _fill(self, key: ProfileKey, config: Config):
+        """Fetch and parse one opponent's page (runs on the fill workers)"""
+        server, tournament_id, snr = key
+        try:
+            # Leave the host alone while its breaker is open; retry on a later lookup
+            breaker = get_breaker(
+                config.get_host(),
+                config.breaker_failure_threshold,
+                config.breaker_reset_timeout,
+            )
+            if not breaker.allow_request():
+                return
+
+            with ChessResultsClient(config) as client:
+                html = client.fetch_profile_html(snr)
+
+            # Only the host failing to answer counts against its breaker
+            if client.host_unavailable:
+                breaker.record_failure()
+                return
+            breaker.record_success()
+            if not html:
+                return
+
+            profile = get_parse_executor().parse_player_profile(html)
+            self._cache[key] = (time.monotonic(), profile)
+
+        except Exception as e:
+            print(f"⚠️  Opponent profile fetch failed [{tournament_id}/{snr}]: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+
+# Shared by every monitor in the process
+opponent_profiles = OpponentProfileCache()
@@ -0,0 +1,187 @@
+"""
+Live Elo rating changes for every watched player, computed in one batch
+"""
+
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from ..models.tournament import Tournament
+from .memory import LRUCache, memory_registry
+
+# Result cell -> score; anything else (pending, forfeits) is not rated
+SCORES = {"1": 1.0, "0": 0.0, "0.5": 0.5, "½": 0.5}
+
+# FIDE caps the rating difference used for expected scores at 400
+MAX_DIFFERENCE = 400
+
+
+def default_k_factor(rating: float) -> float:
+    """FIDE K-factor from the rating alone (age and game count aren't known)"""
+    return 10.0 if rating >= 2400 else 20.0
+
+
+def compute_batch(
+    ratings: np.ndarray,
+    k_factors: np.ndarray,
+    opponent_ratings: np.ndarray,
+    scores: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expected scores and rating changes for many players at once
+
+    Args:
+        ratings, k_factors: Shape (players,)
+        opponent_ratings, scores: Shape (players, rounds); NaN where a
+            round is unplayed, pending or against an unrated opponent
+
+    Returns:
+        tuple: (expected, delta), both (players, rounds) with NaN for
+            games that don't count
+    """
+    difference = np.clip(
+        opponent_ratings - ratings[:, None], -MAX_DIFFERENCE, MAX_DIFFERENCE
+    )
+    expected = 1.0 / (1.0 + 10.0 ** (difference / 400.0))
+    rated = ~np.isnan(opponent_ratings) & ~np.isnan(scores)
+    expected = np.where(rated, expected, np.nan)
+    delta = k_factors[:, None] * (scores - expected)
+    return expected, delta
+
+
+class RatingChangeCalculator:
+    """
+    Rating changes for all watched players of a tournament
+
+    Monitors submit their player's games as results land; the first lookup
+    afterwards recomputes the whole tournament's batch in one vectorized
+    pass. Results are cached per (tournament, round), so sessions polling
+    between results reuse them.
+    """
+
+    def __init__(self):
+        # (server, tournament_id) -> {snr: (rating, k, [(round, opp rating, score)])}
+        self._inputs: Dict[Tuple[str, str], Dict[str, tuple]] = {}
+        # (server, tournament_id, round) -> (version, {snr: result})
+        self._results = LRUCache(256)
+        memory_registry.register_cache("rating_changes", self._results)
+        # Drawn from one counter, so a pruned tournament never reuses a version
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._last_version = 0
+        self._lock = threading.Lock()
+
+    def submit(self, server: str, tournament: Tournament) -> bool:
+        """Record a player's rating and games; False if they aren't rated"""
+        player = tournament.player
+        if not player.rating or not player.rating.isdigit():
+            return False
+
+        rating = float(player.rating)
+        k_factor = (
+            float(player.k_factor)
+            if player.k_factor and player.k_factor.isdigit()
+            else default_k_factor(rating)
+        )
+        games = [
+            (int(m.round_number), float(m.opponent_rating), SCORES[m.result])
+            for m in tournament.matches
+            if m.round_number.isdigit()
+            and m.opponent_rating
+            and m.opponent_rating.isdigit()
+            and m.result in SCORES
+        ]
+        entry = (rating, k_factor, games)
+
+        key = (server, tournament.tournament_id)
+        with self._lock:
+            players = self._inputs.setdefault(key, {})
+            if players.get(player.snr) != entry:
+                players[player.snr] = entry
+                self._last_version += 1
+                self._versions[key] = self._last_version
+        return True
+
+    def forget(self, server: str, tournament_id: str, snr: str):
+        """Stop including a player in their tournament's batch"""
+        with self._lock:
+            players = self._inputs.get((server, tournament_id), {})
+            players.pop(snr, None)
+            if not players:
+                self._inputs.pop((server, tournament_id), None)
+
+    def prune(self, live_tournaments: Set[Tuple[str, str]]):
+        """Drop the batches and results of tournaments no live session watches"""
+        with self._lock:
+            for key in list(self._inputs):
+                if key not in live_tournaments:
+                    del self._inputs[key]
+            for key in list(self._versions):
+                if key not in live_tournaments:
+                    del self._versions[key]
+        for key, _ in self._results.items():
+            if key[:2] not in live_tournaments:
+                self._results.pop(key, None)
+
+    def get(self, server: str, tournament_id: str, snr: str) -> Optional[dict]:
+        """
+        A player's rating changes
+
+        Returns:
+            dict: {"total": ..., "rounds": {round: {"expected", "delta"}}},
+                or None if the player hasn't been submitted
+        """
+        key = (server, tournament_id)
+        with self._lock:
+            players = dict(self._inputs.get(key, {}))
+            version = self._versions.get(key, 0)
+        if snr not in players:
+            return None
+
+        last_round = max(
+            (game[0] for _, _, games in players.values() for game in games), default=0
+        )
+        cache_key = (server, tournament_id, last_round)
+        cached = self._results.get(cache_key)
+        if cached is None or cached[0] != version:
+            cached = (version, self._compute(players))
+            self._results[cache_key] = cached
+        return cached[1].get(snr)
+
+    def _compute(self, players: Dict[str, tuple]) -> Dict[str, dict]:
+        """Run the batch for every submitted player of one tournament"""
+        snrs: List[str] = list(players)
+        rounds = max(
+            (game[0] for _, _, games in players.values() for game in games), default=0
+        )
+
+        ratings = np.array([players[snr][0] for snr in snrs])
+        k_factors = np.array([players[snr][1] for snr in snrs])
+        opponent_ratings = np.full((len(snrs), rounds), np.nan)
+        scores = np.full((len(snrs), rounds), np.nan)
+        for row, snr in enumerate(snrs):
+            for round_num, opponent_rating, score in players[snr][2]:
+                opponent_ratings[row, round_num - 1] = opponent_rating
+                scores[row, round_num - 1] = score
+
+        expected, delta = compute_batch(ratings, k_factors, opponent_ratings, scores)
+        totals = np.nansum(delta, axis=1)
+
+        results = {}
+        for row, snr in enumerate(snrs):
+            played = np.flatnonzero(~np.isnan(delta[row]))
+            results[snr] = {
+                "rating": float(ratings[row]),
+                "k_factor": float(k_factors[row]),
+                "total": round(float(totals[row]), 2),
+                "rounds": {
+                    str(col + 1): {
+                        "expected": round(float(expected[row, col]), 3),
+                        "delta": round(float(delta[row, col]), 2),
+                    }
+                    for col in played
+                },
+            }
+        return results
+
+
+# Shared by every monitor in the process
+rating_changes = RatingChangeCalculator()
@@ -0,0 +1,110 @@
+"""
+Retention for finished sessions: archiving, in-memory cleanup and space reclaim
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Set
+from ..database import Database
+
+
+class SessionReaper:
+    """
+    Keeps the live tables and in-memory state down to sessions that matter
+
+    Every ``interval`` seconds, sessions that finished or failed more than
+    ``retention_hours`` ago are moved to the archive table as one compressed
+    snapshot each, archives older than ``archive_retention_days`` are
+    deleted, and every registered cleanup callback is handed the IDs still
+    in the live table so it can drop state of the rest (including sessions
+    stopped or archived by another process). SQLite's WAL is checkpointed
+    each pass; VACUUM runs at most every ``vacuum_interval`` seconds, and
+    only after rows were deleted.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        retention_hours: int = 24,
+        archive_retention_days: int = 180,
+        interval: int = 3600,
+        vacuum_interval: int = 86400,
+        batch_size: int = 100,
+    ):
+        self.db = db
+        self.retention_hours = retention_hours
+        self.archive_retention_days = archive_retention_days
+        self.interval = interval
+        self.vacuum_interval = vacuum_interval
+        self.batch_size = batch_size
+        self._cleanups: List[Callable[[Set[str]], None]] = []
+        self._reclaimable = 0  # rows deleted since the last VACUUM
+        self._last_vacuum = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_cleanup(self, cleanup: Callable[[Set[str]], None]):
+        """Register ``cleanup(live_session_ids)`` to run after each pass"""
+        self._cleanups.append(cleanup)
+
+    def start(self):
+        """Start the background reaper loop"""
+        self._thread = threading.Thread(
+            target=self._run, name="session-reaper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the reaper loop"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        """Reap every ``interval`` seconds until stopped"""
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"⚠️  Session reaper error: {e}")
+
+    def run_once(self) -> dict:
+        """Archive, purge, clean up and reclaim space once; returns counts"""
+        now = datetime.now()
+
+        archived = []
+        while True:
+            batch = self.db.archive_sessions(
+                now - timedelta(hours=self.retention_hours), self.batch_size
+            )
+            archived += batch
+            if len(batch) < self.batch_size:
+                break
+
+        purged = 0
+        if self.archive_retention_days:
+            purged = self.db.purge_archive(
+                now - timedelta(days=self.archive_retention_days)
+            )
+
+        live = self.db.get_session_ids()
+        for cleanup in self._cleanups:
+            cleanup(live)
+
+        self._reclaimable += len(archived) + purged
+        vacuum = (
+            self._reclaimable > 0
+            and time.monotonic() - self._last_vacuum >= self.vacuum_interval
+        )
+        self.db.reclaim_space(vacuum=vacuum)
+        if vacuum:
+            self._reclaimable = 0
+            self._last_vacuum = time.monotonic()
+
+        if archived or purged:
+            print(
+                f"🧹 Archived {len(archived)} finished sessions, "
+                f"purged {purged} old archives{' and vacuumed' if vacuum else ''}"
+            )
+        return {"archived": len(archived), "purged": purged, "vacuumed": vacuum}
@@ -0,0 +1,80 @@
+"""
+Tournament-wide standings shared across all watched players
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+from ..api.client import ChessResultsClient
+from ..parsers.parse_pool import get_parse_executor
+from .memory import LRUCache, memory_registry
+
+StandingsTable = Dict[str, Dict[str, str]]
+
+
+class StandingsFetcher:
+    """
+    Fetches each tournament's standings page at most once per poll interval
+
+    Every session watching a player in the same tournament shares one cached
+    standings table, so rank and points cost one request per tournament
+    instead of one per player.
+    """
+
+    def __init__(self):
+        # (server, tournament_id) -> (fetched_at, standings)
+        self._cache = LRUCache(64)
+        memory_registry.register_cache("standings", self._cache)
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _get_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        """Get the per-tournament lock, creating it if needed"""
+        with self._lock:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def get_standings(self, client: ChessResultsClient) -> Optional[StandingsTable]:
+        """Get the standings for the client's tournament, fetching if stale"""
+        config = client.config
+        key = (config.server, config.tournament_id)
+
+        # Only one session per tournament fetches; the others wait and reuse it
+        with self._get_lock(key):
+            cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < config.check_interval:
+                return cached[1]
+
+            html = client.fetch_standings_html()
+            if not html:
+                return cached[1] if cached else None
+
+            standings = get_parse_executor().parse_standings(html)
+            if not standings:
+                return cached[1] if cached else None
+
+            self._cache[key] = (time.monotonic(), standings)
+            return standings
+
+    def get_cached_standings(
+        self, server: str, tournament_id: str
+    ) -> Optional[StandingsTable]:
+        """Get the last fetched standings for a tournament without fetching"""
+        cached = self._cache.get((server, tournament_id))
+        return cached[1] if cached else None
+
+    def prune(self, live_tournaments: Set[Tuple[str, str]]):
+        """Drop the standings and locks of tournaments no live session watches"""
+        for key, _ in self._cache.items():
+            if key not in live_tournaments:
+                self._cache.pop(key, None)
+        with self._lock:
+            for key, lock in list(self._locks.items()):
+                # A held lock is a fetch in progress; it goes on a later pass
+                if key not in live_tournaments and not lock.locked():
+                    del self._locks[key]
+
+
+# Shared by every monitor in the process
+standings_fetcher = StandingsFetcher()
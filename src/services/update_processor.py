@@ -0,0 +1,86 @@
+"""
+Update processing stage decoupled from the polling loop
+"""
+
+import queue
+import threading
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from ..models.match import Match
+from ..models.tournament import Tournament
+
+
+@dataclass
+class UpdateEvent:
+    """A change detected by a monitor, waiting for its side effects"""
+
+    session_id: str
+    tournament: Optional[Tournament] = None
+    new_round: Optional[Match] = None
+    error: Optional[str] = None
+    status: Optional[str] = None
+    changes: List[dict] = field(default_factory=list)
+    detected_at: datetime = field(default_factory=datetime.now)
+    trace: Optional[Dict[str, float]] = None  # stage timestamps, see freshness.py
+
+
+class UpdateProcessor:
+    """
+    Applies update side effects (DB writes, SSE queue puts) on a worker pool
+
+    Each session is pinned to one worker so its events are processed in
+    order. Worker queues are bounded: when downstream falls behind, submit()
+    blocks until there is room, so a slow database slows polling down
+    instead of losing updates. Nothing is ever dropped, since a monitor has
+    already moved past a state once it hands it over.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[UpdateEvent], None],
+        num_workers: int = 2,
+        queue_size: int = 100,
+    ):
+        self.handler = handler
+        self.queues: List[queue.Queue] = [
+            queue.Queue(maxsize=queue_size) for _ in range(max(1, num_workers))
+        ]
+        self.threads: List[threading.Thread] = []
+
+    def start(self):
+        """Start the worker threads"""
+        for i, work_q in enumerate(self.queues):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(work_q,),
+                name=f"update-worker-{i}",
+                daemon=True,
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, event: UpdateEvent):
+        """Hand an event to its session's worker, waiting while its queue is full"""
+        work_q = self.queues[zlib.crc32(event.session_id.encode()) % len(self.queues)]
+        work_q.put(event)
+
+    def stop(self):
+        """Stop the worker threads after draining their queues"""
+        for work_q in self.queues:
+            work_q.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def _worker(self, work_q: queue.Queue):
+        """Process events from one queue until stopped"""
+        while True:
+            event = work_q.get()
+            if event is None:
+                break
+            try:
+                self.handler(event)
+            except Exception as e:
+                print(f"❌ Update processing error [{event.session_id}]: {e}")
@@ -0,0 +1,124 @@
+"""
+Versioned binary encoding for stored tournament snapshots
+
+Every blob starts with a 4-byte header: b"CR", the format version and the
+codec ID, so rows written with any registered codec stay readable after the
+default changes. Set SNAPSHOT_CODEC to pick the codec for new writes.
+"""
+
+import json
+import os
+import zlib
+from typing import Any, Callable, Dict, NamedTuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"CR"
+FORMAT_VERSION = 1
+
+
+class Codec(NamedTuple):
+    """A registered snapshot codec"""
+
+    codec_id: int
+    name: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[bytes], Any]
+
+
+_codecs_by_id: Dict[int, Codec] = {}
+_codecs_by_name: Dict[str, Codec] = {}
+
+
+def register_codec(
+    codec_id: int,
+    name: str,
+    encode: Callable[[Any], bytes],
+    decode: Callable[[bytes], Any],
+):
+    """Make a codec available for writing by name and for reading by ID"""
+    codec = Codec(codec_id, name, encode, decode)
+    _codecs_by_id[codec_id] = codec
+    _codecs_by_name[name] = codec
+
+
+def available_codecs() -> Dict[str, Codec]:
+    """Registered codecs by name"""
+    return dict(_codecs_by_name)
+
+
+def default_codec_name() -> str:
+    """Codec used for new writes: SNAPSHOT_CODEC, else the best one installed"""
+    name = os.environ.get("SNAPSHOT_CODEC")
+    if name:
+        return name
+    return "msgpack-zlib" if "msgpack-zlib" in _codecs_by_name else "json-zlib"
+
+
+def check_default_codec():
+    """Fail fast when SNAPSHOT_CODEC names a codec that isn't available here"""
+    name = default_codec_name()
+    if name not in _codecs_by_name:
+        raise ValueError(
+            f"Unknown or unavailable snapshot codec {name!r} (SNAPSHOT_CODEC); "
+            f"available: {', '.join(sorted(_codecs_by_name))}"
+        )
+
+
+def encode(data: Any, codec_name: str = None) -> bytes:
+    """Encode a snapshot with a header naming its codec"""
+    name = codec_name or default_codec_name()
+    codec = _codecs_by_name.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown snapshot codec: {name}")
+    return MAGIC + bytes([FORMAT_VERSION, codec.codec_id]) + codec.encode(data)
+
+
+def decode(blob: bytes) -> Any:
+    """Decode a snapshot written by any registered codec"""
+    if blob[:2] != MAGIC or len(blob) < 4:
+        raise ValueError("Not a snapshot blob")
+    if blob[2] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version: {blob[2]}")
+
+    codec = _codecs_by_id.get(blob[3])
+    if codec is None:
+        raise ValueError(f"Snapshot written with unavailable codec ID {blob[3]}")
+    return codec.decode(memoryview(blob)[4:])
+
+
+# Built-in codecs; IDs are stored in every blob, so never reuse one
+register_codec(
+    1,
+    "json-zlib",
+    lambda data: zlib.compress(
+        json.dumps(data, separators=(",", ":")).encode("utf-8"), 6
+    ),
+    lambda payload: json.loads(zlib.decompress(payload)),
+)
+
+if msgpack is not None:
+    register_codec(
+        2,
+        "msgpack-zlib",
+        lambda data: zlib.compress(msgpack.packb(data), 6),
+        lambda payload: msgpack.unpackb(zlib.decompress(payload)),
+    )
+
+if msgpack is not None and zstandard is not None:
+    register_codec(
+        3,
+        "msgpack-zstd",
+        lambda data: zstandard.ZstdCompressor(level=3).compress(msgpack.packb(data)),
+        lambda payload: msgpack.unpackb(
+            zstandard.ZstdDecompressor().decompress(payload)
+        ),
+    )